@@ -10,6 +10,11 @@ from .version_detector import Version
 
 DistributionName = Literal["core", "contrib"]
 
+# Use the libyaml-backed loaders when PyYAML was built with them. The base loader
+# skips tag resolution and returns every scalar as a string.
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_BASE_LOADER = getattr(yaml, "CBaseLoader", yaml.BaseLoader)
+
 
 class InventoryManager:
     """Manages component inventory storage and retrieval."""
@@ -24,6 +29,19 @@ class InventoryManager:
             inventory_dir: Base directory for versioned metadata (default: collector-metadata)
         """
         self.inventory_dir = Path(inventory_dir)
+        self._version_index: dict[str, list[Version]] = {}
+
+    def refresh(self, distribution: DistributionName | None = None) -> None:
+        """
+        Drop cached version listings so later lookups rescan the disk.
+
+        Args:
+            distribution: Distribution to refresh, or None to refresh all distributions
+        """
+        if distribution is None:
+            self._version_index.clear()
+        else:
+            self._version_index.pop(distribution, None)
 
     def get_version_dir(self, distribution: DistributionName, version: Version) -> Path:
         """
@@ -74,6 +92,8 @@ class InventoryManager:
                     component_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True
                 )
 
+        self.refresh(distribution)
+
     def load_versioned_inventory(
         self, distribution: DistributionName, version: Version
     ) -> dict[str, Any]:
@@ -100,7 +120,7 @@ class InventoryManager:
 
             if file_path.exists():
                 with open(file_path) as f:
-                    data = yaml.safe_load(f) or {}
+                    data = yaml.load(f, Loader=YAML_SAFE_LOADER) or {}
                     components[component_type] = data.get("components", [])
                     if not repository:
                         repository = data.get("repository", "")
@@ -118,6 +138,23 @@ class InventoryManager:
         """
         List all available versions for a distribution.
 
+        Args:
+            distribution: Distribution name
+
+        Returns:
+            List of versions, sorted newest to oldest
+        """
+        versions = self._version_index.get(distribution)
+        if versions is None:
+            versions = self._scan_versions(distribution)
+            self._version_index[distribution] = versions
+
+        return list(versions)
+
+    def _scan_versions(self, distribution: DistributionName) -> list[Version]:
+        """
+        Scan the inventory directory for the versions of a distribution.
+
         Args:
             distribution: Distribution name
 
@@ -171,6 +208,7 @@ class InventoryManager:
                 shutil.rmtree(snapshot_dir)
                 count += 1
 
+        self.refresh(distribution)
         return count
 
     def version_exists(self, distribution: DistributionName, version: Version) -> bool:
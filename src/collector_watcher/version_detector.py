@@ -1,5 +1,7 @@
 """Version detection for OpenTelemetry Collector repositories."""
 
+import dataclasses
+import functools
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -8,9 +10,9 @@ from typing import Literal
 import git
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Version:
-    """Represents a semantic version."""
+    """Represents a semantic version. Instances are immutable so parsed versions can be shared."""
 
     major: int
     minor: int
@@ -18,10 +20,13 @@ class Version:
     is_snapshot: bool = False
 
     @classmethod
+    @functools.lru_cache(maxsize=1024)
     def from_string(cls, version_str: str) -> "Version":
         """
         Parse a version string.
 
+        Results are cached, since the same handful of version strings is parsed repeatedly.
+
         Args:
             version_str: Version string (e.g., "v0.112.0" or "v0.113.0-SNAPSHOT")
 
@@ -79,17 +84,6 @@ class Version:
         """Greater than or equal comparison."""
         return not self < other
 
-    def __eq__(self, other: object) -> bool:
-        """Check equality."""
-        if not isinstance(other, Version):
-            return False
-        return (
-            self.major == other.major
-            and self.minor == other.minor
-            and self.patch == other.patch
-            and self.is_snapshot == other.is_snapshot
-        )
-
     def next_patch(self) -> "Version":
         """Return next patch version."""
         return Version(self.major, self.minor, self.patch + 1)
@@ -194,6 +188,4 @@ class VersionDetector:
         if latest is None:
             return Version(0, 0, 1, is_snapshot=True)
 
-        next_version = latest.next_patch()
-        next_version.is_snapshot = True
-        return next_version
+        return dataclasses.replace(latest.next_patch(), is_snapshot=True)
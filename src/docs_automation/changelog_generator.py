@@ -73,8 +73,8 @@ class ChangelogGenerator:
         old_map = {self._get_component_key(c): c for c in old_components}
         new_map = {self._get_component_key(c): c for c in new_components}
 
-        old_keys = set(old_map.keys())
-        new_keys = set(new_map.keys())
+        old_keys = old_map.keys()
+        new_keys = new_map.keys()
 
         # Get subtypes present in the old inventory to detect scanner capability changes
         old_subtypes = self._get_subtypes_in_list(old_components)
@@ -107,6 +107,8 @@ class ChangelogGenerator:
         for name in sorted(old_keys & new_keys):
             old_comp = old_map[name]
             new_comp = new_map[name]
+            if old_comp is new_comp:
+                continue
 
             # Check stability changes (skip connectors as they have different stability model)
             if component_type != "connector":
@@ -154,15 +156,19 @@ class ChangelogGenerator:
             Dictionary mapping component_type to changes
         """
         changes = {}
+        if old_inventory is new_inventory:
+            return changes
 
         old_components = old_inventory.get("components", {})
         new_components = new_inventory.get("components", {})
 
-        all_types = set(old_components.keys()) | set(new_components.keys())
+        all_types = old_components.keys() | new_components.keys()
 
         for component_type in sorted(all_types):
             old_comps = old_components.get(component_type, [])
             new_comps = new_components.get(component_type, [])
+            if old_comps is new_comps:
+                continue
 
             type_changes = self.compare_component_type(component_type, old_comps, new_comps)
 
@@ -223,7 +229,7 @@ class ChangelogGenerator:
                     new_stab = change["new"]
 
                     # Find what changed
-                    all_signals = set(old_stab.keys()) | set(new_stab.keys())
+                    all_signals = old_stab.keys() | new_stab.keys()
                     signal_changes = []
                     for signal in sorted(all_signals):
                         old_val = old_stab.get(signal, "-")
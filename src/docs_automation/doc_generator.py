@@ -135,6 +135,18 @@ class DocGenerator:
         else:
             return [c for c in components if c.get("subtype") == subtype]
 
+    def _sort_components(self, components: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Sort components alphabetically by name for table rendering.
+
+        Args:
+            components: List of components
+
+        Returns:
+            New list of components sorted by name
+        """
+        return sorted(components, key=lambda c: c.get("name", ""))
+
     def _generate_component_table(
         self,
         component_type: str,
@@ -255,7 +267,7 @@ class DocGenerator:
         """
         # Filter by subtype if specified
         filtered = self._filter_by_subtype(components, subtype)
-        sorted_components = sorted(filtered, key=lambda c: c.get("name", ""))
+        sorted_components = self._sort_components(filtered)
         return self._generate_component_table(
             component_type, sorted_components, subtype=subtype, include_footnotes=include_footnotes
         )
@@ -1,8 +1,14 @@
 """Update existing documentation files with generated content using markers."""
 
 import re
+from itertools import pairwise
 from pathlib import Path
 
+from docs_automation.file_utils import write_text_atomic
+
+# Optional SOURCE metadata and the closing of a marker comment; old-format markers omit SOURCE
+_MARKER_SUFFIX = re.compile(r"(?:\s+SOURCE:\s+[\w-]+)? -->")
+
 
 class DocUpdater:
     """Updates markdown files by replacing content between marker comments."""
@@ -32,6 +38,35 @@ class DocUpdater:
         end = f"<!-- END {self.marker_prefix}: {marker_id} SOURCE: {self.source} -->"
         return begin, end
 
+    def _find_marker(
+        self, content: str, kind: str, marker_id: str, start: int = 0
+    ) -> tuple[int, int] | None:
+        """
+        Find the next BEGIN or END marker for a marker ID.
+
+        Matches both old format (without SOURCE) and new format (with SOURCE).
+        The marker text is located with a literal search, so no pattern ever spans
+        the content between markers.
+
+        Args:
+            content: Markdown content to search
+            kind: Marker kind, either "BEGIN" or "END"
+            marker_id: Marker identifier
+            start: Offset to start searching from
+
+        Returns:
+            Tuple of (start, end) offsets of the marker, or None if not found
+        """
+        prefix = f"<!-- {kind} {self.marker_prefix}: {marker_id}"
+        pos = content.find(prefix, start)
+        while pos >= 0:
+            # Anchored at the end of the prefix, so "section" won't match "section-2"
+            suffix = _MARKER_SUFFIX.match(content, pos + len(prefix))
+            if suffix:
+                return pos, suffix.end()
+            pos = content.find(prefix, pos + 1)
+        return None
+
     def update_section(self, content: str, marker_id: str, new_content: str) -> tuple[str, bool]:
         """
         Update a section of content between markers.
@@ -48,31 +83,23 @@ class DocUpdater:
             was_updated is False if markers weren't found
         """
         begin_marker, end_marker = self.get_marker_pattern(marker_id)
+        replacement = f"{begin_marker}\n{new_content}\n{end_marker}"
 
-        # Try to match both old format (without SOURCE) and new format (with SOURCE)
-        # Old format: <!-- BEGIN GENERATED: marker-id -->
-        # New format: <!-- BEGIN GENERATED: marker-id SOURCE: collector-watcher -->
-        begin_pattern = (
-            re.escape(f"<!-- BEGIN {self.marker_prefix}: {marker_id}")
-            + r"(?:\s+SOURCE:\s+[\w-]+)?"
-            + re.escape(" -->")
-        )
-        end_pattern = (
-            re.escape(f"<!-- END {self.marker_prefix}: {marker_id}")
-            + r"(?:\s+SOURCE:\s+[\w-]+)?"
-            + re.escape(" -->")
-        )
-
-        pattern = begin_pattern + r".*?" + end_pattern
-        regex = re.compile(pattern, re.DOTALL)
-
-        if not regex.search(content):
+        parts = []
+        last = 0
+        while (begin := self._find_marker(content, "BEGIN", marker_id, last)) is not None:
+            end = self._find_marker(content, "END", marker_id, begin[1])
+            if end is None:
+                break
+            parts.append(content[last : begin[0]])
+            parts.append(replacement)
+            last = end[1]
+
+        if not parts:
             return content, False
 
-        replacement = f"{begin_marker}\n{new_content}\n{end_marker}"
-        updated_content = regex.sub(replacement, content)
-
-        return updated_content, True
+        parts.append(content[last:])
+        return "".join(parts), True
 
     def update_multiple_sections(
         self, content: str, updates: dict[str, str]
@@ -88,16 +115,80 @@ class DocUpdater:
             Tuple of (updated_content, results_dict)
             results_dict maps marker_id to whether it was updated
         """
-        results = {}
-        current_content = content
+        results = dict.fromkeys(updates, False)
+        if not updates:
+            return content, results
+
+        # Match the requested IDs literally, longest first, so any ID update_section
+        # accepts is found and "section" never shadows "section-2"
+        id_alternatives = "|".join(map(re.escape, sorted(updates, key=len, reverse=True)))
+        marker_token = re.compile(
+            r"<!-- (BEGIN|END) "
+            + re.escape(self.marker_prefix)
+            + f": ({id_alternatives})"
+            + _MARKER_SUFFIX.pattern
+        )
 
-        for marker_id, new_content in updates.items():
-            current_content, was_updated = self.update_section(
-                current_content, marker_id, new_content
+        # Walk the marker tokens once, recording the span of every complete section
+        spans: list[tuple[int, int, str]] = []
+        open_begins: dict[str, re.Match[str]] = {}
+        overlapping = False
+        for match in marker_token.finditer(content):
+            kind, marker_id = match.groups()
+            if kind == "BEGIN":
+                open_begins.setdefault(marker_id, match)
+                continue
+
+            begin = open_begins.pop(marker_id, None)
+            if begin is None:
+                continue
+            spans.append((begin.start(), match.end(), marker_id))
+            # A section opened inside this one and still open crosses its END marker
+            overlapping = overlapping or any(
+                other.start() > begin.start() for other in open_begins.values()
             )
-            results[marker_id] = was_updated
 
-        return current_content, results
+        spans.sort()
+        overlapping = overlapping or any(
+            start < previous_end for (_, previous_end, _), (start, _, _) in pairwise(spans)
+        )
+        if overlapping:
+            # Nested or crossing sections make the result depend on the order of the
+            # updates, so apply them one at a time exactly as update_section would
+            return self._update_sections_in_order(content, updates)
+
+        parts = []
+        last = 0
+        for start, end, marker_id in spans:
+            begin_marker, end_marker = self.get_marker_pattern(marker_id)
+            parts.append(content[last:start])
+            parts.append(f"{begin_marker}\n{updates[marker_id]}\n{end_marker}")
+            last = end
+            results[marker_id] = True
+
+        if not parts:
+            return content, results
+
+        parts.append(content[last:])
+        return "".join(parts), results
+
+    def _update_sections_in_order(
+        self, content: str, updates: dict[str, str]
+    ) -> tuple[str, dict[str, bool]]:
+        """
+        Apply update_section for each marker ID in turn.
+
+        Args:
+            content: Original markdown content
+            updates: Dictionary mapping marker_id to new_content
+
+        Returns:
+            Tuple of (updated_content, results_dict)
+        """
+        results = {}
+        for marker_id, new_content in updates.items():
+            content, results[marker_id] = self.update_section(content, marker_id, new_content)
+        return content, results
 
     def update_file(self, file_path: Path | str, marker_id: str, new_content: str) -> bool:
         """
@@ -125,7 +216,7 @@ class DocUpdater:
         if not was_updated:
             return False
 
-        file_path.write_text(updated_content, encoding="utf-8")
+        write_text_atomic(file_path, updated_content)
         return True
 
     def update_file_multiple(
@@ -153,6 +244,6 @@ class DocUpdater:
         updated_content, results = self.update_multiple_sections(original_content, updates)
 
         if any(results.values()):
-            file_path.write_text(updated_content, encoding="utf-8")
+            write_text_atomic(file_path, updated_content)
 
         return results
@@ -0,0 +1,40 @@
+"""File helpers shared by the documentation automation scripts."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+# os.umask can only be read by setting it, so read it once at import rather than
+# toggling process-wide state on every write
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_text_atomic(file_path: Path | str, content: str) -> None:
+    """
+    Write text to a file by replacing it, so readers never see a partial write.
+
+    Symlinks are followed, so the link target is updated and the link itself is kept.
+    An existing file keeps its permission bits.
+
+    Args:
+        file_path: Path to the file to write
+        content: Text content to write
+    """
+    target = Path(file_path).resolve()
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+
+        if target.exists():
+            shutil.copymode(target, temp_name)
+        else:
+            # mkstemp creates owner-only files; give new files the usual umask-based mode
+            os.chmod(temp_name, 0o666 & ~_UMASK)
+
+        os.replace(temp_name, target)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
@@ -7,11 +7,21 @@ identifies component names, and updates the cSpell:ignore line in the YAML
 front matter of each affected file.
 """
 
+import functools
 import re
 import subprocess
 import sys
+from collections import defaultdict
 from pathlib import Path
 
+from collector_watcher.inventory import YAML_BASE_LOADER
+from docs_automation.file_utils import write_text_atomic
+
+CSPELL_IGNORE_PREFIX = "cSpell:ignore:"
+
+# cspell output format: "filename:line:col - Unknown word (word)"
+_CSPELL_LINE = re.compile(r"^(.+?):\d+:\d+[ \t]+-[ \t]+Unknown word \(([^)\n]+)\)", re.MULTILINE)
+
 
 def run_cspell(docs_repo_path: Path) -> dict[str, list[str]]:
     """
@@ -45,21 +55,12 @@ def run_cspell(docs_repo_path: Path) -> dict[str, list[str]]:
         )
 
         # Parse cspell output to extract misspelled words
-        # cspell output format: "filename:line:col - Unknown word (word)"
-        misspellings: dict[str, list[str]] = {}
-        pattern = r"^(.+?):(\d+):(\d+)\s+-\s+Unknown word \((.+?)\)"
-
-        for line in result.stdout.split("\n"):
-            match = re.match(pattern, line)
-            if match:
-                filepath = match.group(1)
-                word = match.group(4)
-
-                if filepath not in misspellings:
-                    misspellings[filepath] = []
-                misspellings[filepath].append(word)
+        misspellings: defaultdict[str, list[str]] = defaultdict(list)
+        for match in _CSPELL_LINE.finditer(result.stdout):
+            filepath, word = match.groups()
+            misspellings[filepath].append(word)
 
-        return misspellings
+        return dict(misspellings)
 
     except FileNotFoundError:
         print("Error: npx not found. Make sure Node.js is installed.", file=sys.stderr)
@@ -69,10 +70,13 @@ def run_cspell(docs_repo_path: Path) -> dict[str, list[str]]:
         sys.exit(1)
 
 
-def load_component_names(inventory_path: Path) -> set[str]:
+@functools.lru_cache(maxsize=4)
+def load_component_names(inventory_path: Path) -> frozenset[str]:
     """
     Load all component names from the inventory.
 
+    The result is cached per inventory path, since the inventory doesn't change during a run.
+
     Args:
         inventory_path: Path to collector-metadata directory
 
@@ -83,84 +87,101 @@ def load_component_names(inventory_path: Path) -> set[str]:
 
     component_names = set()
 
-    # Find all component YAML files from all versions (to catch all component names)
-    for dist_dir in inventory_path.iterdir():
-        if not dist_dir.is_dir():
-            continue
-
-        # Process all version directories to collect all component names
-        for version_dir in dist_dir.iterdir():
-            if not version_dir.is_dir():
-                continue
+    # Find all component YAML files from all versions (to catch all component names),
+    # laid out as <distribution>/<version>/<component_type>.yaml
+    for component_file in inventory_path.glob("*/*/*.yaml"):
+        with open(component_file, encoding="utf-8") as f:
+            # Only names are read, so skip resolving the other scalars' types
+            data = yaml.load(f, Loader=YAML_BASE_LOADER)
+            components = data.get("components", [])
+            for comp in components:
+                name = comp.get("name")
+                if name:
+                    component_names.add(name)
 
-            # Read all component files
-            for component_file in version_dir.glob("*.yaml"):
-                with open(component_file, encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                    components = data.get("components", [])
-                    for comp in components:
-                        name = comp.get("name")
-                        if name:
-                            component_names.add(name)
+    return frozenset(component_names)
 
-    return component_names
 
-
-def update_frontmatter_ignore_list(file_path: Path, new_words: set[str]) -> bool:
+def _update_frontmatter_ignore_list_text(content: str, new_words: set[str]) -> tuple[str, bool]:
     """
-    Update the cSpell:ignore line in the markdown front matter.
+    Update the cSpell:ignore line in the front matter of markdown text.
 
     Args:
-        file_path: Path to markdown file
+        content: Markdown content
         new_words: Words to add to ignore list
 
     Returns:
-        True if file was modified
+        Tuple of (updated_content, has_frontmatter)
+        updated_content is the original content if it has no front matter
     """
-    with open(file_path) as f:
-        content = f.read()
+    # Split off front matter (between --- delimiters) with literal searches
+    head, opening, rest = content.partition("---\n")
+    frontmatter, closing, body = rest.partition("\n---\n")
 
-    # Match front matter (between --- delimiters)
-    frontmatter_pattern = r"^---\n(.*?)\n---\n"
-    match = re.match(frontmatter_pattern, content, re.DOTALL)
-
-    if not match:
-        print(f"  ⚠️  No front matter found in {file_path.name}")
-        return False
-
-    frontmatter = match.group(1)
-    frontmatter_end = match.end()
+    if head or not opening or not closing:
+        return content, False
 
     # Find cSpell:ignore line
-    cspell_pattern = r"cSpell:ignore:\s*(.+)"
-    cspell_match = re.search(cspell_pattern, frontmatter)
+    frontmatter_lines = frontmatter.split("\n")
+    for index, line in enumerate(frontmatter_lines):
+        stripped = line.lstrip()
+        if not stripped.startswith(CSPELL_IGNORE_PREFIX):
+            continue
 
-    if cspell_match:
         # Parse existing words
-        existing_words_str = cspell_match.group(1).strip()
-        existing_words = set(existing_words_str.split())
+        existing_words = set(stripped[len(CSPELL_IGNORE_PREFIX) :].split())
 
         # Combine and sort
         all_words = existing_words | new_words
         sorted_words = sorted(all_words, key=str.lower)
 
-        # Replace the line
-        new_cspell_line = f"cSpell:ignore: {' '.join(sorted_words)}"
-        new_frontmatter = frontmatter.replace(cspell_match.group(0), new_cspell_line)
+        # Replace the line, keeping its indentation
+        indent = line[: len(line) - len(stripped)]
+        frontmatter_lines[index] = f"{indent}{CSPELL_IGNORE_PREFIX} {' '.join(sorted_words)}"
+        break
     else:
-        # Add new cSpell:ignore line before the closing ---
+        # Add new cSpell:ignore line at the end of frontmatter (before the closing ---)
         sorted_words = sorted(new_words, key=str.lower)
-        new_cspell_line = f"cSpell:ignore: {' '.join(sorted_words)}"
+        frontmatter_lines.append(f"{CSPELL_IGNORE_PREFIX} {' '.join(sorted_words)}")
 
-        # Add the line at the end of frontmatter (before the closing ---)
-        new_frontmatter = frontmatter + f"\n{new_cspell_line}"
+    new_frontmatter = "\n".join(frontmatter_lines)
 
     # Reconstruct the content
-    new_content = f"---\n{new_frontmatter}\n---\n" + content[frontmatter_end:]
+    return f"---\n{new_frontmatter}\n---\n" + body, True
+
+
+def update_frontmatter_ignore_list(file_path: Path, new_words: set[str]) -> bool:
+    """
+    Update the cSpell:ignore line in the markdown front matter.
+
+    Args:
+        file_path: Path to markdown file
+        new_words: Words to add to ignore list
+
+    Returns:
+        True if new_words is empty, without opening the file. Otherwise False if
+        the file has no front matter and True if it does. The file is only
+        rewritten when at least one word isn't already ignored.
+    """
+    # Nothing to add, so skip reading and rewriting the file
+    if not new_words:
+        return True
+
+    with open(file_path, encoding="utf-8") as f:
+        content = f.read()
+
+    new_content, has_frontmatter = _update_frontmatter_ignore_list_text(content, new_words)
+
+    if not has_frontmatter:
+        print(f"  ⚠️  No front matter found in {file_path.name}")
+        return False
+
+    # Every word was already ignored, so leave the file untouched
+    if new_content == content:
+        return True
 
     # Write back
-    with open(file_path, "w") as f:
-        f.write(new_content)
+    write_text_atomic(file_path, new_content)
 
     return True
 
@@ -18,6 +18,7 @@ Usage:
        # Open http://localhost:1313/docs/collector/components/
 """
 
+import bisect
 import sys
 from pathlib import Path
 
@@ -53,24 +54,23 @@ def merge_inventories(core_inventory: dict, contrib_inventory: dict) -> dict:
         core_comps = core_inventory.get("components", {}).get(component_type, [])
         contrib_comps = contrib_inventory.get("components", {}).get(component_type, [])
 
+        # Experimental "x" components (e.g., xreceiver, xexporter, xconnector) are skipped
+        experimental_name = f"x{component_type}"
+
         # Create a map of component name to component data
         component_map = {}
 
         # Add core components (excluding experimental "x" components)
         for comp in core_comps:
             name = comp.get("name")
-            # Skip experimental "x" components (e.g., xreceiver, xexporter, xconnector)
-            if name == f"x{component_type}":
+            if name == experimental_name:
                 continue
-            comp_copy = comp.copy()
-            comp_copy["source_repo"] = "core"
-            component_map[name] = comp_copy
+            component_map[name] = comp | {"source_repo": "core"}
 
         # Merge or add contrib components (excluding experimental "x" components)
         for comp in contrib_comps:
             name = comp.get("name")
-            # Skip experimental "x" components (e.g., xreceiver, xexporter, xconnector)
-            if name == f"x{component_type}":
+            if name == experimental_name:
                 continue
             if name in component_map:
                 # Component exists in both - merge distributions
@@ -99,9 +99,7 @@ def merge_inventories(core_inventory: dict, contrib_inventory: dict) -> dict:
                 # Keep source_repo as "core" since component is in core repo
             else:
                 # Component only in contrib
-                comp_copy = comp.copy()
-                comp_copy["source_repo"] = "contrib"
-                component_map[name] = comp_copy
+                component_map[name] = comp | {"source_repo": "contrib"}
 
         # Convert map back to list and sort alphabetically by name for consistent output
         merged["components"][component_type] = sorted(
@@ -131,20 +129,16 @@ def get_best_available_version(
     if inv_mgr.version_exists(distribution, target_version):
         return target_version
 
-    # Get all non-snapshot versions
-    all_versions = [v for v in inv_mgr.list_versions(distribution) if not v.is_snapshot]
+    # Get all non-snapshot versions, sorted oldest to newest
+    all_versions = [v for v in reversed(inv_mgr.list_versions(distribution)) if not v.is_snapshot]
 
     if not all_versions:
         raise ValueError(f"No versions found for {distribution}")
 
-    # Find the latest version that's not newer than target
-    # (versions are sorted newest to oldest)
-    for version in all_versions:
-        if version <= target_version:
-            return version
-
-    # If no suitable version found, use the oldest available
-    return all_versions[-1]
+    # Find the latest version that's not newer than target,
+    # or use the oldest available if every version is newer
+    index = bisect.bisect_right(all_versions, target_version) - 1
+    return all_versions[max(index, 0)]
 
 
 def main():
@@ -1,9 +1,5 @@
 """Tests for inventory manager."""
 
-import shutil
-import tempfile
-from pathlib import Path
-
 import pytest
 import yaml
 
@@ -11,14 +7,6 @@ from collector_watcher.inventory import InventoryManager
 from collector_watcher.version_detector import Version
 
 
-@pytest.fixture
-def temp_inventory_dir():
-    """Create a temporary directory for inventory files."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
-
-
 @pytest.fixture
 def sample_components():
     """Sample component data for testing."""
@@ -51,8 +39,8 @@ def sample_snapshot_version():
     return Version(0, 113, 0, is_snapshot=True)
 
 
-def test_save_versioned_inventory(temp_inventory_dir, sample_components, sample_version):
-    manager = InventoryManager(str(temp_inventory_dir))
+def test_save_versioned_inventory(tmp_path, sample_components, sample_version):
+    manager = InventoryManager(str(tmp_path))
 
     manager.save_versioned_inventory(
         distribution="contrib",
@@ -61,7 +49,7 @@ def test_save_versioned_inventory(temp_inventory_dir, sample_components, sample_
         repository="opentelemetry-collector-contrib",
     )
 
-    version_dir = temp_inventory_dir / "contrib" / "v0.112.0"
+    version_dir = tmp_path / "contrib" / "v0.112.0"
     assert version_dir.exists()
     assert (version_dir / "receiver.yaml").exists()
     assert (version_dir / "processor.yaml").exists()
@@ -76,9 +64,9 @@ def test_save_versioned_inventory(temp_inventory_dir, sample_components, sample_
     assert len(loaded["components"]) == 2
 
 
-def test_load_versioned_inventory(temp_inventory_dir, sample_components, sample_version):
+def test_load_versioned_inventory(tmp_path, sample_components, sample_version):
     """Test loading versioned inventory."""
-    manager = InventoryManager(str(temp_inventory_dir))
+    manager = InventoryManager(str(tmp_path))
 
     # Save first
     manager.save_versioned_inventory(
@@ -97,9 +85,9 @@ def test_load_versioned_inventory(temp_inventory_dir, sample_components, sample_
     assert loaded["components"] == sample_components
 
 
-def test_load_nonexistent_versioned_inventory(temp_inventory_dir, sample_version):
+def test_load_nonexistent_versioned_inventory(tmp_path, sample_version):
     """Test loading versioned inventory that doesn't exist."""
-    manager = InventoryManager(str(temp_inventory_dir))
+    manager = InventoryManager(str(tmp_path))
 
     loaded = manager.load_versioned_inventory("contrib", sample_version)
 
@@ -108,9 +96,9 @@ def test_load_nonexistent_versioned_inventory(temp_inventory_dir, sample_version
     assert loaded["components"] == {}
 
 
-def test_list_versions(temp_inventory_dir, sample_components):
+def test_list_versions(tmp_path, sample_components):
     """Test listing available versions."""
-    manager = InventoryManager(str(temp_inventory_dir))
+    manager = InventoryManager(str(tmp_path))
 
     # Create multiple versions
     v1 = Version(0, 110, 0)
@@ -135,9 +123,37 @@ def test_list_versions(temp_inventory_dir, sample_components):
     assert str(versions[2]) == "v0.110.0"
 
 
-def test_list_snapshot_versions(temp_inventory_dir, sample_components):
+def test_list_versions_cached_until_refresh(tmp_path, sample_components):
+    """Test that version listings are cached until refreshed or changed via the manager."""
+    manager = InventoryManager(str(tmp_path))
+    manager.save_versioned_inventory(
+        distribution="contrib",
+        version=Version(0, 110, 0),
+        components=sample_components,
+        repository="opentelemetry-collector-contrib",
+    )
+    assert manager.list_versions("contrib") == [Version(0, 110, 0)]
+
+    # Directories created outside the manager aren't seen until a refresh
+    (tmp_path / "contrib" / "v0.111.0").mkdir()
+    assert manager.list_versions("contrib") == [Version(0, 110, 0)]
+
+    manager.refresh("contrib")
+    assert manager.list_versions("contrib") == [Version(0, 111, 0), Version(0, 110, 0)]
+
+    # Saving through the manager invalidates the cache
+    manager.save_versioned_inventory(
+        distribution="contrib",
+        version=Version(0, 112, 0),
+        components=sample_components,
+        repository="opentelemetry-collector-contrib",
+    )
+    assert manager.list_versions("contrib")[0] == Version(0, 112, 0)
+
+
+def test_list_snapshot_versions(tmp_path, sample_components):
     """Test listing snapshot versions."""
-    manager = InventoryManager(str(temp_inventory_dir))
+    manager = InventoryManager(str(tmp_path))
 
     # Create mix of release and snapshot versions
     v1 = Version(0, 112, 0)
@@ -159,9 +175,9 @@ def test_list_snapshot_versions(temp_inventory_dir, sample_components):
     assert all(v.is_snapshot for v in snapshots)
 
 
-def test_cleanup_snapshots(temp_inventory_dir, sample_components):
+def test_cleanup_snapshots(tmp_path, sample_components):
     """Test cleaning up snapshot versions."""
-    manager = InventoryManager(str(temp_inventory_dir))
+    manager = InventoryManager(str(tmp_path))
 
     # Create mix of release and snapshot versions
     v1 = Version(0, 112, 0)
@@ -185,6 +201,7 @@ def test_cleanup_snapshots(temp_inventory_dir, sample_components):
     removed = manager.cleanup_snapshots("contrib")
 
     assert removed == 2
+    assert manager.list_snapshot_versions("contrib") == []
     # Release should still exist
     assert manager.version_exists("contrib", v1)
     # Snapshots should be gone
@@ -192,9 +209,9 @@ def test_cleanup_snapshots(temp_inventory_dir, sample_components):
     assert not manager.version_exists("contrib", v3)
 
 
-def test_version_exists(temp_inventory_dir, sample_components, sample_version):
+def test_version_exists(tmp_path, sample_components, sample_version):
     """Test checking if version exists."""
-    manager = InventoryManager(str(temp_inventory_dir))
+    manager = InventoryManager(str(tmp_path))
 
     assert not manager.version_exists("contrib", sample_version)
 
@@ -208,11 +225,9 @@ def test_version_exists(temp_inventory_dir, sample_components, sample_version):
     assert manager.version_exists("contrib", sample_version)
 
 
-def test_versioned_inventory_separate_distributions(
-    temp_inventory_dir, sample_components, sample_version
-):
+def test_versioned_inventory_separate_distributions(tmp_path, sample_components, sample_version):
     """Test that different distributions are stored separately."""
-    manager = InventoryManager(str(temp_inventory_dir))
+    manager = InventoryManager(str(tmp_path))
 
     # Save to both distributions
     manager.save_versioned_inventory(
@@ -230,8 +245,8 @@ def test_versioned_inventory_separate_distributions(
     )
 
     # Verify both exist separately
-    core_dir = temp_inventory_dir / "core" / "v0.112.0"
-    contrib_dir = temp_inventory_dir / "contrib" / "v0.112.0"
+    core_dir = tmp_path / "core" / "v0.112.0"
+    contrib_dir = tmp_path / "contrib" / "v0.112.0"
 
     assert core_dir.exists()
     assert contrib_dir.exists()
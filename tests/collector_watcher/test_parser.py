@@ -1,52 +1,41 @@
 """Tests for metadata parser."""
 
-import shutil
-import tempfile
 from pathlib import Path
 
-import pytest
-
 from collector_watcher.parser import MetadataParser
 
 
-@pytest.fixture
-def temp_component_dir():
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
-
-
 def create_metadata_file(component_dir: Path, content: str):
     metadata_path = component_dir / "metadata.yaml"
     metadata_path.write_text(content)
     return metadata_path
 
 
-def test_parse_type_field(temp_component_dir):
-    create_metadata_file(temp_component_dir, "type: otlp")
-    parser = MetadataParser(temp_component_dir)
+def test_parse_type_field(tmp_path):
+    create_metadata_file(tmp_path, "type: otlp")
+    parser = MetadataParser(tmp_path)
     metadata = parser.parse()
 
     assert metadata is not None
     assert metadata["type"] == "otlp"
 
 
-def test_parse_status_basic(temp_component_dir):
+def test_parse_status_basic(tmp_path):
     content = """
 type: test
 status:
   class: receiver
   distributions: [contrib, custom]
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
+    create_metadata_file(tmp_path, content)
+    parser = MetadataParser(tmp_path)
     metadata = parser.parse()
 
     assert metadata["status"]["class"] == "receiver"
     assert metadata["status"]["distributions"] == ["contrib", "custom"]
 
 
-def test_parse_status_stability(temp_component_dir):
+def test_parse_status_stability(tmp_path):
     content = """
 type: test
 status:
@@ -56,8 +45,8 @@ status:
     beta: [logs]
     alpha: [profiles]
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
+    create_metadata_file(tmp_path, content)
+    parser = MetadataParser(tmp_path)
     metadata = parser.parse()
 
     stability = metadata["status"]["stability"]
@@ -69,22 +58,22 @@ status:
     assert stability["alpha"] == ["profiles"]
 
 
-def test_parse_status_unsupported_platforms(temp_component_dir):
+def test_parse_status_unsupported_platforms(tmp_path):
     content = """
 type: test
 status:
   class: receiver
   unsupported_platforms: [windows, linux, darwin]
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
+    create_metadata_file(tmp_path, content)
+    parser = MetadataParser(tmp_path)
     metadata = parser.parse()
 
     # Should be sorted
     assert metadata["status"]["unsupported_platforms"] == ["darwin", "linux", "windows"]
 
 
-def test_parse_attributes(temp_component_dir):
+def test_parse_attributes(tmp_path):
     """Test parsing attributes with deterministic ordering."""
     content = """
 type: test
@@ -100,8 +89,8 @@ attributes:
     type: string
     enum: [z_value, a_value, m_value]
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
+    create_metadata_file(tmp_path, content)
+    parser = MetadataParser(tmp_path)
     metadata = parser.parse()
 
     attrs = metadata["attributes"]
@@ -111,7 +100,7 @@ attributes:
     assert attrs["middle_attr"]["enum"] == ["a_value", "m_value", "z_value"]
 
 
-def test_parse_metrics(temp_component_dir):
+def test_parse_metrics(tmp_path):
     """Test parsing metrics with deterministic ordering."""
     content = """
 type: test
@@ -132,8 +121,8 @@ metrics:
     gauge:
       value_type: int
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
+    create_metadata_file(tmp_path, content)
+    parser = MetadataParser(tmp_path)
     metadata = parser.parse()
 
     metrics = metadata["metrics"]
@@ -143,7 +132,7 @@ metrics:
     assert metrics["system.cpu.usage"]["attributes"] == ["cpu", "state"]
 
 
-def test_parse_resource_attributes(temp_component_dir):
+def test_parse_resource_attributes(tmp_path):
     content = """
 type: test
 resource_attributes:
@@ -154,45 +143,45 @@ resource_attributes:
     description: Service name
     type: string
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
+    create_metadata_file(tmp_path, content)
+    parser = MetadataParser(tmp_path)
     metadata = parser.parse()
 
     res_attrs = metadata["resource_attributes"]
     assert list(res_attrs.keys()) == ["host.name", "service.name"]
 
 
-def test_parse_malformed_yaml(temp_component_dir):
+def test_parse_malformed_yaml(tmp_path):
     content = """
 type: test
 status:
   class: receiver
   invalid: [unclosed list
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
+    create_metadata_file(tmp_path, content)
+    parser = MetadataParser(tmp_path)
     metadata = parser.parse()
 
     # Should return None for malformed YAML
     assert metadata is None
 
 
-def test_parse_empty_file(temp_component_dir):
-    create_metadata_file(temp_component_dir, "")
-    parser = MetadataParser(temp_component_dir)
+def test_parse_empty_file(tmp_path):
+    create_metadata_file(tmp_path, "")
+    parser = MetadataParser(tmp_path)
     metadata = parser.parse()
 
     assert metadata is None
 
 
-def test_parse_missing_file(temp_component_dir):
-    parser = MetadataParser(temp_component_dir)
+def test_parse_missing_file(tmp_path):
+    parser = MetadataParser(tmp_path)
     metadata = parser.parse()
 
     assert metadata is None
 
 
-def test_parse_complete_metadata(temp_component_dir):
+def test_parse_complete_metadata(tmp_path):
     content = """
 type: active_directory_ds
 status:
@@ -222,8 +211,8 @@ metrics:
     stability:
       level: development
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
+    create_metadata_file(tmp_path, content)
+    parser = MetadataParser(tmp_path)
     metadata = parser.parse()
 
     assert metadata is not None
@@ -233,7 +222,7 @@ metrics:
     assert "active_directory.ds.replication.network.io" in metadata["metrics"]
 
 
-def test_deterministic_output(temp_component_dir):
+def test_deterministic_output(tmp_path):
     content = """
 type: test
 status:
@@ -247,8 +236,8 @@ attributes:
   a_attr:
     type: int
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
+    create_metadata_file(tmp_path, content)
+    parser = MetadataParser(tmp_path)
 
     metadata1 = parser.parse()
     metadata2 = parser.parse()
@@ -258,7 +247,7 @@ attributes:
     assert list(metadata1["attributes"].keys()) == list(metadata2["attributes"].keys())
 
 
-def test_parse_display_name(temp_component_dir):
+def test_parse_display_name(tmp_path):
     content = """
 display_name: Test Receiver
 type: test
@@ -266,8 +255,8 @@ status:
   class: receiver
   distributions: [contrib, custom]
 """
-    create_metadata_file(temp_component_dir, content)
-    parser = MetadataParser(temp_component_dir)
+    create_metadata_file(tmp_path, content)
+    parser = MetadataParser(tmp_path)
     metadata = parser.parse()
 
     assert metadata["display_name"] == "Test Receiver"
@@ -1,19 +1,14 @@
 """Tests for component scanner."""
 
-import shutil
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from collector_watcher.scanner import ComponentScanner
 
 
 @pytest.fixture
-def mock_repo():
+def mock_repo(tmp_path):
     """Create a temporary mock repository structure."""
-    temp_dir = tempfile.mkdtemp()
-    repo_path = Path(temp_dir)
+    repo_path = tmp_path
 
     receiver_with_meta = repo_path / "receiver" / "otlpreceiver"
     receiver_with_meta.mkdir(parents=True)
@@ -50,9 +45,7 @@ def mock_repo():
     hidden_dir.mkdir(parents=True)
     (hidden_dir / "go.mod").touch()
 
-    yield repo_path
-
-    shutil.rmtree(temp_dir)
+    return repo_path
 
 
 def test_scan_receivers(mock_repo):
@@ -87,17 +80,15 @@ def test_metadata_detection(mock_repo):
     scanner = ComponentScanner(str(mock_repo))
     components = scanner.scan_all_components()
 
-    otlp = next(r for r in components["receiver"] if r["name"] == "otlpreceiver")
-    assert "metadata" in otlp
-
-    custom = next(r for r in components["receiver"] if r["name"] == "customreceiver")
-    assert custom.get("has_metadata") is False
+    by_name = {
+        component_type: {c["name"]: c for c in comps}
+        for component_type, comps in components.items()
+    }
 
-    batch = next(p for p in components["processor"] if p["name"] == "batchprocessor")
-    assert "metadata" in batch
-
-    logging = next(e for e in components["exporter"] if e["name"] == "loggingexporter")
-    assert "metadata" in logging
+    assert "metadata" in by_name["receiver"]["otlpreceiver"]
+    assert by_name["receiver"]["customreceiver"].get("has_metadata") is False
+    assert "metadata" in by_name["processor"]["batchprocessor"]
+    assert "metadata" in by_name["exporter"]["loggingexporter"]
 
 
 def test_scan_all_components(mock_repo):
@@ -114,10 +105,9 @@ def test_scan_all_components(mock_repo):
 
 
 @pytest.fixture
-def mock_repo_with_nested():
+def mock_repo_with_nested(tmp_path):
     """Create a temporary mock repository with nested extension directories."""
-    temp_dir = tempfile.mkdtemp()
-    repo_path = Path(temp_dir)
+    repo_path = tmp_path
 
     # Create a regular extension
     regular_ext = repo_path / "extension" / "healthcheckextension"
@@ -163,10 +153,7 @@ def mock_repo_with_nested():
     internal_dir.mkdir(parents=True)
     (internal_dir / "go.mod").touch()
 
-    yield repo_path
-
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    return repo_path
 
 
 def test_scan_nested_encoding_extensions(mock_repo_with_nested):
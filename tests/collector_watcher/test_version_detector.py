@@ -1,5 +1,7 @@
 """Tests for version detection."""
 
+import dataclasses
+
 import pytest
 
 from collector_watcher.version_detector import Version
@@ -31,6 +33,28 @@ class TestVersion:
         assert v.patch == 0
         assert v.is_snapshot
 
+    def test_from_string_cached(self):
+        """Test that parsing the same string returns the shared cached instance."""
+        assert Version.from_string("v0.112.0") is Version.from_string("v0.112.0")
+
+    def test_immutable(self):
+        """Test that versions can't be mutated, since parsed instances are shared."""
+        v = Version.from_string("v0.112.0")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            v.is_snapshot = True  # type: ignore[misc]
+
+    def test_hashable(self):
+        """Test that equal versions hash equally."""
+        assert len({Version(0, 112, 0), Version.from_string("v0.112.0")}) == 1
+
+    def test_slots(self):
+        """Test that versions don't carry a per-instance __dict__."""
+        assert not hasattr(Version(0, 112, 0), "__dict__")
+
+    def test_not_equal_to_other_types(self):
+        """Test that versions never compare equal to their string form."""
+        assert Version(0, 112, 0) != "v0.112.0"
+
     def test_from_string_invalid(self):
         """Test parsing invalid version raises error."""
         with pytest.raises(ValueError):
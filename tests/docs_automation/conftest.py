@@ -0,0 +1,106 @@
+"""Shared fixtures for docs automation tests."""
+
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from collector_watcher.inventory import InventoryManager
+from collector_watcher.version_detector import Version
+from docs_automation.doc_generator import DocGenerator
+from docs_automation.update_docs import get_best_available_version, merge_inventories
+
+# Use the libyaml-backed dumper when PyYAML was built with it
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@pytest.fixture(scope="session")
+def doc_generator():
+    """Create a DocGenerator instance shared by all tests (read-only usage)."""
+    return DocGenerator(version="v0.138.0")
+
+
+@pytest.fixture(scope="session")
+def temp_inventory_dir(tmp_path_factory):
+    """Create a temporary inventory directory shared by all tests (read-only usage)."""
+    tmpdir_path = tmp_path_factory.mktemp("inventory")
+
+    # Core: v0.140.0 (stable) and v0.139.0 (older stable)
+    core_data = {
+        "distribution": "core",
+        "version": "v0.140.0",
+        "repository": "opentelemetry-collector",
+        "component_type": "extension",
+        "components": [
+            {
+                "name": "memorylimiterextension",
+                "metadata": {
+                    "status": {
+                        "distributions": [],
+                        "stability": {"development": ["extension"]},
+                    }
+                },
+            }
+        ],
+    }
+
+    # Contrib: v0.140.1 (stable) and v0.140.0 (older stable)
+    contrib_data = {
+        "distribution": "contrib",
+        "version": "v0.140.1",
+        "repository": "opentelemetry-collector-contrib",
+        "component_type": "extension",
+        "components": [
+            {
+                "name": "ackextension",
+                "metadata": {
+                    "status": {
+                        "distributions": ["contrib"],
+                        "stability": {"alpha": ["extension"]},
+                    }
+                },
+            }
+        ],
+    }
+
+    # Serialize each distribution once; older versions differ only in the version string
+    for data, older_version in ((core_data, "v0.139.0"), (contrib_data, "v0.140.0")):
+        template = yaml.dump(data, Dumper=_DUMPER)
+        for version in (data["version"], older_version):
+            version_dir = tmpdir_path / data["distribution"] / version
+            version_dir.mkdir(parents=True)
+            (version_dir / "extension.yaml").write_text(
+                template.replace(data["version"], version, 1)
+            )
+
+    return tmpdir_path
+
+
+@pytest.fixture(scope="session")
+def real_inventory_manager():
+    """InventoryManager over the checked-in collector-metadata, shared by all tests."""
+    return InventoryManager("collector-metadata")
+
+
+@pytest.fixture(scope="session")
+def merged_v140(real_inventory_manager):
+    """
+    Load and merge the real v0.140.1 inventories once, for tests that only read them.
+
+    Contrib has v0.140.1 while core is still at v0.140.0, so core falls back.
+    """
+    inv_mgr = real_inventory_manager
+    target_version = Version.from_string("v0.140.1")
+
+    core_version = get_best_available_version(inv_mgr, "core", target_version)
+    contrib_version = get_best_available_version(inv_mgr, "contrib", target_version)
+    core_inventory = inv_mgr.load_versioned_inventory("core", core_version)
+    contrib_inventory = inv_mgr.load_versioned_inventory("contrib", contrib_version)
+
+    return SimpleNamespace(
+        core_version=core_version,
+        contrib_version=contrib_version,
+        core_inventory=core_inventory,
+        contrib_inventory=contrib_inventory,
+        merged=merge_inventories(core_inventory, contrib_inventory),
+    )
@@ -1,46 +1,34 @@
 """Tests for changelog generator."""
 
-from docs_automation.changelog_generator import ChangelogGenerator
-
+import pytest
 
-def test_compare_component_type_new_component():
-    """Test detecting newly added components."""
-    gen = ChangelogGenerator()
-
-    old_components = [
-        {"name": "component1", "metadata": {}},
-    ]
-
-    new_components = [
-        {"name": "component1", "metadata": {}},
-        {"name": "component2", "metadata": {}},
-    ]
+from docs_automation.changelog_generator import ChangelogGenerator
 
-    changes = gen.compare_component_type("receiver", old_components, new_components)
 
-    assert changes["added"] == ["component2"]
-    assert changes["removed"] == []
-    assert changes["stability_changed"] == []
-    assert changes["distribution_changed"] == []
+def _inventory(**components):
+    """Build a minimal inventory with the given component lists."""
+    return {"components": components}
 
 
-def test_compare_component_type_removed_component():
-    """Test detecting removed components."""
+@pytest.mark.parametrize(
+    ("old_names", "new_names", "added", "removed"),
+    [
+        (["component1"], ["component1", "component2"], ["component2"], []),
+        (["component1", "component2"], ["component1"], [], ["component2"]),
+    ],
+    ids=["added", "removed"],
+)
+def test_compare_component_type_membership_change(old_names, new_names, added, removed):
+    """Test detecting added and removed components."""
     gen = ChangelogGenerator()
 
-    old_components = [
-        {"name": "component1", "metadata": {}},
-        {"name": "component2", "metadata": {}},
-    ]
-
-    new_components = [
-        {"name": "component1", "metadata": {}},
-    ]
+    old_components = [{"name": name, "metadata": {}} for name in old_names]
+    new_components = [{"name": name, "metadata": {}} for name in new_names]
 
     changes = gen.compare_component_type("receiver", old_components, new_components)
 
-    assert changes["added"] == []
-    assert changes["removed"] == ["component2"]
+    assert changes["added"] == added
+    assert changes["removed"] == removed
     assert changes["stability_changed"] == []
     assert changes["distribution_changed"] == []
 
@@ -151,28 +139,17 @@ def test_compare_inventories():
     """Test comparing complete inventories."""
     gen = ChangelogGenerator()
 
-    old_inventory = {
-        "components": {
-            "receiver": [
-                {"name": "receiver1", "metadata": {}},
-            ],
-            "processor": [
-                {"name": "processor1", "metadata": {}},
-            ],
-        }
-    }
-
-    new_inventory = {
-        "components": {
-            "receiver": [
-                {"name": "receiver1", "metadata": {}},
-                {"name": "receiver2", "metadata": {}},
-            ],
-            "processor": [
-                {"name": "processor1", "metadata": {}},
-            ],
-        }
-    }
+    old_inventory = _inventory(
+        receiver=[{"name": "receiver1", "metadata": {}}],
+        processor=[{"name": "processor1", "metadata": {}}],
+    )
+    new_inventory = _inventory(
+        receiver=[
+            {"name": "receiver1", "metadata": {}},
+            {"name": "receiver2", "metadata": {}},
+        ],
+        processor=[{"name": "processor1", "metadata": {}}],
+    )
 
     changes = gen.compare_inventories(old_inventory, new_inventory)
 
@@ -181,6 +158,17 @@ def test_compare_inventories():
     assert "processor" not in changes  # No changes in processor
 
 
+def test_compare_inventories_same_object():
+    """Test that comparing an inventory with itself reports no changes."""
+    gen = ChangelogGenerator()
+
+    inventory = _inventory(
+        receiver=[{"name": "receiver1", "metadata": {"status": {"distributions": ["core"]}}}],
+    )
+
+    assert gen.compare_inventories(inventory, inventory) == {}
+
+
 def test_format_changes_markdown_new_components():
     """Test markdown formatting for new components."""
     gen = ChangelogGenerator()
@@ -1,177 +1,288 @@
 """Tests for documentation generator."""
 
-import pytest
-
-from docs_automation.doc_generator import DocGenerator
-
-
-@pytest.fixture
-def doc_generator():
-    """Create a DocGenerator instance for testing."""
-    return DocGenerator(version="v0.138.0")
-
-
-class TestGetStabilityBySignal:
-    """Tests for get_stability_by_signal function."""
-
-    def test_get_stability_single_signal_beta(self, doc_generator):
-        metadata = {"status": {"stability": {"beta": ["metrics"]}}}
-        result = doc_generator.get_stability_by_signal(metadata)
-        assert result == {"metrics": "beta"}
-
-    def test_get_stability_multiple_signals_same_level(self, doc_generator):
-        metadata = {"status": {"stability": {"beta": ["traces", "metrics", "logs"]}}}
-        result = doc_generator.get_stability_by_signal(metadata)
-        assert result == {"traces": "beta", "metrics": "beta", "logs": "beta"}
-
-    def test_get_stability_multiple_signals_different_levels(self, doc_generator):
-        metadata = {"status": {"stability": {"beta": ["traces", "metrics"], "alpha": ["logs"]}}}
-        result = doc_generator.get_stability_by_signal(metadata)
-        assert result == {"traces": "beta", "metrics": "beta", "logs": "alpha"}
-
-    def test_get_stability_extension(self, doc_generator):
-        metadata = {"status": {"stability": {"beta": ["extension"]}}}
-        result = doc_generator.get_stability_by_signal(metadata)
-        assert result == {"extension": "beta"}
-
-    def test_get_stability_no_metadata(self, doc_generator):
-        assert doc_generator.get_stability_by_signal({}) == {}
-        assert doc_generator.get_stability_by_signal(None) == {}
-
-    def test_get_stability_no_stability_field(self, doc_generator):
-        metadata = {"status": {}}
-        assert doc_generator.get_stability_by_signal(metadata) == {}
+import re
 
-    def test_get_stability_empty_stability(self, doc_generator):
-        metadata = {"status": {"stability": {}}}
-        assert doc_generator.get_stability_by_signal(metadata) == {}
-
-    def test_get_stability_partial_signals(self, doc_generator):
-        metadata = {"status": {"stability": {"alpha": ["traces"]}}}
-        result = doc_generator.get_stability_by_signal(metadata)
-        assert result == {"traces": "alpha"}
-
-    def test_get_stability_development_level(self, doc_generator):
-        metadata = {"status": {"stability": {"development": ["traces", "logs"]}}}
-        result = doc_generator.get_stability_by_signal(metadata)
-        assert result == {"traces": "development", "logs": "development"}
+import pytest
 
-    def test_get_stability_unmaintained_level(self, doc_generator):
-        metadata = {"status": {"stability": {"unmaintained": ["extension"]}}}
-        result = doc_generator.get_stability_by_signal(metadata)
-        assert result == {"extension": "unmaintained"}
+_CONTRIB = "https://github.com/open-telemetry/opentelemetry-collector-contrib/tree/main"
+_CORE = "https://github.com/open-telemetry/opentelemetry-collector/tree/main"
 
+# Component names of receiver table rows, in the order they appear
+_RECEIVER_ROW_NAME_RE = re.compile(r"\| \[(\w+receiver)\]")
 
-class TestIsUnmaintained:
-    """Tests for _is_unmaintained method."""
 
-    def test_is_unmaintained_with_unmaintained_stability(self, doc_generator):
-        """Test component with unmaintained stability level is unmaintained."""
-        component = {
-            "name": "oldreceiver",
-            "metadata": {"status": {"stability": {"unmaintained": ["metrics"]}}},
+# Shared component fixtures in the shape YAML loads (plain dicts and lists). They are
+# not frozen, so tests must copy them before making any change.
+OTLP_RCV = {
+    "name": "otlpreceiver",
+    "metadata": {
+        "status": {
+            "stability": {"beta": ["traces", "metrics", "logs"]},
+            "distributions": ["contrib"],
         }
-        assert doc_generator._is_unmaintained(component) is True
-
-    def test_is_unmaintained_with_normal_stability(self, doc_generator):
-        """Test component with normal stability levels is not unmaintained."""
-        component = {
-            "name": "activereceiver",
-            "metadata": {"status": {"stability": {"beta": ["traces", "metrics"]}}},
+    },
+}
+
+JAEGER_RCV = {
+    "name": "jaegerreceiver",
+    "metadata": {
+        "status": {
+            "stability": {"beta": ["traces"]},
+            "distributions": ["contrib"],
         }
-        assert doc_generator._is_unmaintained(component) is False
-
-    def test_is_unmaintained_no_stability_field(self, doc_generator):
-        """Test component without stability field is not considered unmaintained."""
-        component = {
-            "name": "somereceiver",
-            "metadata": {"status": {}},
+    },
+}
+
+HEALTHCHECK_EXT = {
+    "name": "healthcheckextension",
+    "metadata": {
+        "status": {
+            "stability": {"beta": ["extension"]},
+            "distributions": ["contrib"],
         }
-        assert doc_generator._is_unmaintained(component) is False
-
-    def test_is_unmaintained_no_metadata(self, doc_generator):
-        """Test component without metadata is not considered unmaintained."""
-        component = {"name": "somereceiver"}
-        assert doc_generator._is_unmaintained(component) is False
-
-    def test_is_unmaintained_multiple_stability_levels(self, doc_generator):
-        """Test component with unmaintained among other levels is unmaintained."""
-        component = {
-            "name": "oldreceiver",
-            "metadata": {
-                "status": {
-                    "stability": {
-                        "beta": ["traces"],
-                        "unmaintained": ["metrics"],
-                    }
-                }
+    },
+}
+
+COMPONENTS_RECEIVER_BASIC = [OTLP_RCV, JAEGER_RCV]
+COMPONENTS_EXTENSION_BASIC = [HEALTHCHECK_EXT]
+
+# Receivers spread across core/contrib source repos and distributions
+COMPONENTS_RECEIVER_DISTRIBUTIONS = [
+    {
+        "name": "otlpreceiver",
+        "source_repo": "core",
+        "metadata": {
+            "status": {
+                "stability": {"beta": ["traces", "metrics", "logs"]},
+                "distributions": ["core"],
+            }
+        },
+    },
+    {
+        "name": "jaegerreceiver",
+        "source_repo": "contrib",
+        "metadata": {"status": {"stability": {"beta": ["traces"]}, "distributions": ["contrib"]}},
+    },
+    {
+        "name": "zipkinreceiver",
+        "source_repo": "core",
+        "metadata": {
+            "status": {
+                "stability": {"beta": ["traces"]},
+                "distributions": ["contrib", "core"],
+            }
+        },
+    },
+]
+
+# Regular extension plus one extension of each nested subtype
+SUBTYPE_EXTENSION_INVENTORY = {
+    "components": {
+        "receiver": [],
+        "processor": [],
+        "exporter": [],
+        "connector": [],
+        "extension": [
+            HEALTHCHECK_EXT,
+            {
+                "name": "otlpencodingextension",
+                "subtype": "encoding",
+                "metadata": {
+                    "status": {"stability": {"beta": ["extension"]}, "distributions": ["contrib"]}
+                },
             },
-        }
-        assert doc_generator._is_unmaintained(component) is True
-
-
-class TestGenerateComponentTable:
-    """Tests for generate_component_table function (marker-based approach)."""
-
-    def test_generate_component_table_receiver(self, doc_generator):
-        """Test generating a receiver table with traces/metrics/logs columns."""
-        components = [
             {
-                "name": "otlpreceiver",
+                "name": "hostobserver",
+                "subtype": "observer",
                 "metadata": {
-                    "status": {
-                        "stability": {"beta": ["traces", "metrics", "logs"]},
-                        "distributions": ["contrib"],
-                    }
+                    "status": {"stability": {"alpha": ["extension"]}, "distributions": ["contrib"]}
                 },
             },
             {
-                "name": "jaegerreceiver",
+                "name": "filestorage",
+                "subtype": "storage",
+                "metadata": {
+                    "status": {"stability": {"beta": ["extension"]}, "distributions": ["contrib"]}
+                },
+            },
+        ],
+    }
+}
+
+POPULATED_INVENTORY = {
+    "components": {
+        "receiver": [OTLP_RCV],
+        "processor": [
+            {
+                "name": "batchprocessor",
                 "metadata": {
                     "status": {
-                        "stability": {"beta": ["traces"]},
+                        "stability": {"beta": ["traces", "metrics", "logs"]},
                         "distributions": ["contrib"],
                     }
                 },
+            }
+        ],
+        "exporter": [],
+        "connector": [],
+        "extension": COMPONENTS_EXTENSION_BASIC,
+    }
+}
+
+EMPTY_INVENTORY = {"components": {}}
+
+EXPECTED_TABLE_KEYS = frozenset(
+    {"receiver", "processor", "exporter", "connector", "extension", "extension-footnotes"}
+)
+
+
+@pytest.fixture(scope="module")
+def all_tables_populated(doc_generator):
+    """Tables generated once from POPULATED_INVENTORY (read-only)."""
+    return doc_generator.generate_all_component_tables(POPULATED_INVENTORY)
+
+
+@pytest.fixture(scope="module")
+def all_tables_empty(doc_generator):
+    """Tables generated once from EMPTY_INVENTORY (read-only)."""
+    return doc_generator.generate_all_component_tables(EMPTY_INVENTORY)
+
+
+@pytest.fixture(scope="module")
+def all_tables_subtypes(doc_generator):
+    """Tables generated once from SUBTYPE_EXTENSION_INVENTORY (read-only)."""
+    return doc_generator.generate_all_component_tables(SUBTYPE_EXTENSION_INVENTORY)
+
+
+@pytest.fixture(scope="module")
+def rendered_tables(doc_generator):
+    """Tables for recurring component lists, rendered once per module (read-only)."""
+    return {
+        "receiver_basic": doc_generator.generate_component_table(
+            "receiver", COMPONENTS_RECEIVER_BASIC
+        ),
+        "receiver_distributions": doc_generator.generate_component_table(
+            "receiver", COMPONENTS_RECEIVER_DISTRIBUTIONS
+        ),
+        "extension_basic": doc_generator.generate_component_table(
+            "extension", COMPONENTS_EXTENSION_BASIC
+        ),
+    }
+
+
+STABILITY_CASES = [
+    ({"status": {"stability": {"beta": ["metrics"]}}}, {"metrics": "beta"}),
+    (
+        {"status": {"stability": {"beta": ["traces", "metrics", "logs"]}}},
+        {"traces": "beta", "metrics": "beta", "logs": "beta"},
+    ),
+    (
+        {"status": {"stability": {"beta": ["traces", "metrics"], "alpha": ["logs"]}}},
+        {"traces": "beta", "metrics": "beta", "logs": "alpha"},
+    ),
+    ({"status": {"stability": {"beta": ["extension"]}}}, {"extension": "beta"}),
+    ({}, {}),
+    (None, {}),
+    ({"status": {}}, {}),
+    ({"status": {"stability": {}}}, {}),
+    ({"status": {"stability": {"alpha": ["traces"]}}}, {"traces": "alpha"}),
+    (
+        {"status": {"stability": {"development": ["traces", "logs"]}}},
+        {"traces": "development", "logs": "development"},
+    ),
+    ({"status": {"stability": {"unmaintained": ["extension"]}}}, {"extension": "unmaintained"}),
+]
+
+# Explicit ids keep pytest from repr()-ing the nested metadata dicts at collection time
+STABILITY_CASE_IDS = [
+    "beta_single",
+    "beta_multi",
+    "beta_alpha_mixed",
+    "extension",
+    "empty",
+    "none",
+    "no_stab",
+    "empty_stab",
+    "alpha",
+    "development",
+    "unmaintained",
+]
+
+
+@pytest.mark.parametrize("metadata,expected", STABILITY_CASES, ids=STABILITY_CASE_IDS)
+def test_get_stability_by_signal(doc_generator, metadata, expected):
+    """Test get_stability_by_signal maps each signal to its stability level."""
+    assert doc_generator.get_stability_by_signal(metadata) == expected
+
+
+@pytest.mark.parametrize(
+    "component,expected",
+    [
+        (
+            {
+                "name": "oldreceiver",
+                "metadata": {"status": {"stability": {"unmaintained": ["metrics"]}}},
             },
-        ]
-
-        table_content = doc_generator.generate_component_table("receiver", components)
-
-        assert "| Name | Distributions[^1] | Traces[^2] | Metrics[^2] | Logs[^2] |" in table_content
-        assert "[^1]:" in table_content
-        assert "[^2]:" in table_content
-
-        assert (
-            "| [jaegerreceiver](https://github.com/open-telemetry/opentelemetry-collector-contrib/tree/main/receiver/jaegerreceiver) | contrib | beta | - | - |"
-            in table_content
-        )
-        assert (
-            "| [otlpreceiver](https://github.com/open-telemetry/opentelemetry-collector-contrib/tree/main/receiver/otlpreceiver) | contrib | beta | beta | beta |"
-            in table_content
-        )
-
-    def test_generate_component_table_extension(self, doc_generator):
-        """Test generating an extension table with single stability column."""
-        components = [
+            True,
+        ),
+        (
+            {
+                "name": "activereceiver",
+                "metadata": {"status": {"stability": {"beta": ["traces", "metrics"]}}},
+            },
+            False,
+        ),
+        ({"name": "somereceiver", "metadata": {"status": {}}}, False),
+        ({"name": "somereceiver"}, False),
+        (
             {
-                "name": "healthcheckextension",
+                "name": "oldreceiver",
                 "metadata": {
-                    "status": {"stability": {"beta": ["extension"]}, "distributions": ["contrib"]}
+                    "status": {"stability": {"beta": ["traces"], "unmaintained": ["metrics"]}}
                 },
-            }
-        ]
+            },
+            True,
+        ),
+    ],
+    ids=["unmaint", "beta", "no_stab", "no_md", "mixed_unmaint"],
+)
+def test_is_unmaintained(doc_generator, component, expected):
+    """Test _is_unmaintained flags any component with an unmaintained stability level."""
+    assert doc_generator._is_unmaintained(component) is expected
 
-        table_content = doc_generator.generate_component_table("extension", components)
 
-        assert "| Name | Distributions[^1] | Stability[^2] |" in table_content
-        assert "[^1]:" in table_content
-        assert "[^2]:" in table_content
+class TestGenerateComponentTable:
+    """Tests for generate_component_table function (marker-based approach)."""
 
-        assert (
-            "| [healthcheckextension](https://github.com/open-telemetry/opentelemetry-collector-contrib/tree/main/extension/healthcheckextension) | contrib | beta |"
-            in table_content
-        )
+    @pytest.mark.parametrize(
+        "table_key,expected_rows",
+        [
+            (
+                "receiver_basic",
+                [
+                    "| Name | Distributions[^1] | Traces[^2] | Metrics[^2] | Logs[^2] |",
+                    f"| [jaegerreceiver]({_CONTRIB}/receiver/jaegerreceiver) | contrib | beta | - | - |",
+                    f"| [otlpreceiver]({_CONTRIB}/receiver/otlpreceiver) | contrib | beta | beta | beta |",
+                ],
+            ),
+            (
+                "extension_basic",
+                [
+                    "| Name | Distributions[^1] | Stability[^2] |",
+                    f"| [healthcheckextension]({_CONTRIB}/extension/healthcheckextension) | contrib | beta |",
+                ],
+            ),
+        ],
+        ids=["receiver", "extension"],
+    )
+    def test_generate_component_table_basic(self, rendered_tables, table_key, expected_rows):
+        """Test table header, rows and footnotes for stability-column component types."""
+        lines = set(map(str.strip, rendered_tables[table_key].splitlines()))
+
+        assert "[^1]:" in lines
+        assert "[^2]:" in lines
+        for row in expected_rows:
+            assert row in lines
 
     def test_generate_component_table_connector(self, doc_generator):
         """Test generating a connector table without stability columns."""
@@ -198,76 +309,44 @@ class TestGenerateComponentTable:
         ]
 
         table_content = doc_generator.generate_component_table("connector", components)
+        lines = set(table_content.splitlines())
 
         # Should have simplified header without stability columns
-        assert "| Name | Distributions[^1] |" in table_content
+        assert "| Name | Distributions[^1] |" in lines
         # Should not have Traces/Metrics/Logs columns
-        assert "Traces[^2]" not in table_content
-        assert "Metrics[^2]" not in table_content
-        assert "Logs[^2]" not in table_content
+        assert not any(
+            column in table_content for column in ("Traces[^2]", "Metrics[^2]", "Logs[^2]")
+        )
 
         # Should have distributions footnote but not stability footnote
-        assert "[^1]:" in table_content
-        assert "[^2]:" not in table_content
+        assert "[^1]:" in lines
+        assert "[^2]:" not in lines
 
         # Should not have unmaintained note since connectors don't show stability
         assert "⚠️ **Note:** Components marked with ⚠️ are unmaintained" not in table_content
 
         # Should have component rows with only name and distributions
+        assert f"| [countconnector]({_CONTRIB}/connector/countconnector) | contrib |" in lines
         assert (
-            "| [countconnector](https://github.com/open-telemetry/opentelemetry-collector-contrib/tree/main/connector/countconnector) | contrib |"
-            in table_content
-        )
-        assert (
-            "| [spanmetricsconnector](https://github.com/open-telemetry/opentelemetry-collector-contrib/tree/main/connector/spanmetricsconnector) | contrib |"
-            in table_content
+            f"| [spanmetricsconnector]({_CONTRIB}/connector/spanmetricsconnector) | contrib |"
+            in lines
         )
 
-    def test_generate_component_table_with_distributions(self, doc_generator):
+    def test_generate_component_table_with_distributions(self, rendered_tables):
         """Test that distributions column shows correct values."""
-        components = [
-            {
-                "name": "otlpreceiver",
-                "source_repo": "core",
-                "metadata": {
-                    "status": {
-                        "stability": {"beta": ["traces", "metrics", "logs"]},
-                        "distributions": ["core"],
-                    }
-                },
-            },
-            {
-                "name": "jaegerreceiver",
-                "source_repo": "contrib",
-                "metadata": {
-                    "status": {"stability": {"beta": ["traces"]}, "distributions": ["contrib"]}
-                },
-            },
-            {
-                "name": "zipkinreceiver",
-                "source_repo": "core",
-                "metadata": {
-                    "status": {
-                        "stability": {"beta": ["traces"]},
-                        "distributions": ["contrib", "core"],
-                    }
-                },
-            },
-        ]
-
-        table_content = doc_generator.generate_component_table("receiver", components)
+        lines = set(map(str.strip, rendered_tables["receiver_distributions"].splitlines()))
 
         assert (
-            "[otlpreceiver](https://github.com/open-telemetry/opentelemetry-collector/tree/main/receiver/otlpreceiver) | core |"
-            in table_content
+            f"| [otlpreceiver]({_CORE}/receiver/otlpreceiver) | core | beta | beta | beta |"
+            in lines
         )
         assert (
-            "[jaegerreceiver](https://github.com/open-telemetry/opentelemetry-collector-contrib/tree/main/receiver/jaegerreceiver) | contrib |"
-            in table_content
+            f"| [jaegerreceiver]({_CONTRIB}/receiver/jaegerreceiver) | contrib | beta | - | - |"
+            in lines
         )
         assert (
-            "[zipkinreceiver](https://github.com/open-telemetry/opentelemetry-collector/tree/main/receiver/zipkinreceiver) | contrib, core |"
-            in table_content
+            f"| [zipkinreceiver]({_CORE}/receiver/zipkinreceiver) | contrib, core | beta | - | - |"
+            in lines
         )
 
     def test_format_distributions_capitalizes_k8s(self, doc_generator):
@@ -288,6 +367,14 @@ class TestGenerateComponentTable:
         assert "contrib, K8s" in table_content
         assert "contrib, k8s" not in table_content
 
+    def test_sort_components(self, doc_generator):
+        """Test components are ordered by name without rendering a table."""
+        components = [{"name": "zreceiver"}, {"name": "areceiver"}, {"name": "mreceiver"}]
+
+        sorted_components = doc_generator._sort_components(components)
+
+        assert [c["name"] for c in sorted_components] == ["areceiver", "mreceiver", "zreceiver"]
+
     def test_generate_component_table_sorting(self, doc_generator):
         """Test components are sorted alphabetically."""
         components = [
@@ -313,22 +400,20 @@ class TestGenerateComponentTable:
 
         table_content = doc_generator.generate_component_table("receiver", components)
 
-        a_pos = table_content.find("| [areceiver]")
-        m_pos = table_content.find("| [mreceiver]")
-        z_pos = table_content.find("| [zreceiver]")
+        names = _RECEIVER_ROW_NAME_RE.findall(table_content)
 
         # Verify alphabetical order
-        assert a_pos < m_pos < z_pos
+        assert names == ["areceiver", "mreceiver", "zreceiver"]
 
     def test_generate_component_table_no_metadata(self, doc_generator):
         """Test handling of components without metadata."""
         components = [{"name": "fooprocessor"}]
 
         table_content = doc_generator.generate_component_table("processor", components)
+        lines = set(table_content.splitlines())
 
         assert (
-            "| [fooprocessor](https://github.com/open-telemetry/opentelemetry-collector-contrib/tree/main/processor/fooprocessor) | contrib | - | - | - |"
-            in table_content
+            f"| [fooprocessor]({_CONTRIB}/processor/fooprocessor) | contrib | - | - | - |" in lines
         )
 
     def test_generate_component_table_empty_list(self, doc_generator):
@@ -340,11 +425,8 @@ class TestGenerateComponentTable:
         assert "[^1]:" in table_content
         assert "[^2]:" in table_content
 
-        # But no component rows (only headers)
-        lines = table_content.strip().split("\n")
-        # Count data rows (rows with links that aren't the header)
-        data_rows = [line for line in lines if line.startswith("|") and "](http" in line]
-        assert len(data_rows) == 0
+        # But no component rows (every row starts with a "| [name](url)" link)
+        assert "| [" not in table_content
 
     def test_generate_component_table_unmaintained_component(self, doc_generator):
         """Test that unmaintained components get a warning emoji."""
@@ -370,14 +452,19 @@ class TestGenerateComponentTable:
         ]
 
         table_content = doc_generator.generate_component_table("receiver", components)
+        lines = set(table_content.splitlines())
 
         # Unmaintained component should have emoji
-        assert "[oldreceiver]" in table_content
-        assert "oldreceiver) ⚠️" in table_content
+        assert (
+            f"| [oldreceiver]({_CONTRIB}/receiver/oldreceiver) ⚠️ | contrib | - | unmaintained | - |"
+            in lines
+        )
 
         # Active component should not have emoji
-        assert "[activereceiver]" in table_content
-        assert "activereceiver) ⚠️" not in table_content
+        assert (
+            f"| [activereceiver]({_CONTRIB}/receiver/activereceiver) | contrib | beta | - | - |"
+            in lines
+        )
 
     def test_generate_component_table_unmaintained_extension(self, doc_generator):
         """Test that unmaintained extensions also get warning emoji."""
@@ -423,58 +510,27 @@ class TestGenerateComponentTable:
 class TestGenerateAllComponentTables:
     """Tests for generate_all_component_tables function."""
 
-    def test_generate_all_component_tables(self, doc_generator):
-        """Test generating all component type tables."""
-        inventory = {
-            "components": {
-                "receiver": [
-                    {
-                        "name": "otlpreceiver",
-                        "metadata": {
-                            "status": {
-                                "stability": {"beta": ["traces", "metrics", "logs"]},
-                                "distributions": ["contrib"],
-                            }
-                        },
-                    }
-                ],
-                "processor": [
-                    {
-                        "name": "batchprocessor",
-                        "metadata": {
-                            "status": {
-                                "stability": {"beta": ["traces", "metrics", "logs"]},
-                                "distributions": ["contrib"],
-                            }
-                        },
-                    }
-                ],
-                "exporter": [],
-                "connector": [],
-                "extension": [
-                    {
-                        "name": "healthcheckextension",
-                        "metadata": {
-                            "status": {
-                                "stability": {"beta": ["extension"]},
-                                "distributions": ["contrib"],
-                            }
-                        },
-                    }
-                ],
-            }
-        }
+    def test_generate_all_component_tables_keys(self, all_tables_populated, all_tables_empty):
+        """Test all component types plus extension-footnotes are returned."""
+        assert all_tables_populated.keys() == EXPECTED_TABLE_KEYS
+        assert all_tables_empty.keys() == EXPECTED_TABLE_KEYS
 
-        tables = doc_generator.generate_all_component_tables(inventory)
+    def test_generate_all_component_tables_is_stateless(self, doc_generator):
+        """Test generation leaves the shared generator untouched and is repeatable."""
+        state_before = dict(vars(doc_generator))
+
+        first = doc_generator.generate_all_component_tables(SUBTYPE_EXTENSION_INVENTORY)
+        second = doc_generator.generate_all_component_tables(SUBTYPE_EXTENSION_INVENTORY)
+
+        assert vars(doc_generator) == state_before
+        assert first == second
+
+    def test_generate_all_component_tables(self, all_tables_populated):
+        """Test generating all component type tables."""
+        tables = all_tables_populated
 
         # Should return dict with all component types plus extension-footnotes
-        assert len(tables) == 6
-        assert "receiver" in tables
-        assert "processor" in tables
-        assert "exporter" in tables
-        assert "connector" in tables
-        assert "extension" in tables
-        assert "extension-footnotes" in tables
+        assert tables.keys() == EXPECTED_TABLE_KEYS
 
         # Check receiver table content
         receiver_table = tables["receiver"]
@@ -482,7 +538,7 @@ class TestGenerateAllComponentTables:
             "| Name | Distributions[^1] | Traces[^2] | Metrics[^2] | Logs[^2] |" in receiver_table
         )
         assert (
-            "| [otlpreceiver](https://github.com/open-telemetry/opentelemetry-collector-contrib/tree/main/receiver/otlpreceiver) | contrib | beta | beta | beta |"
+            f"| [otlpreceiver]({_CONTRIB}/receiver/otlpreceiver) | contrib | beta | beta | beta |"
             in receiver_table
         )
 
@@ -490,24 +546,16 @@ class TestGenerateAllComponentTables:
         extension_table = tables["extension"]
         assert "| Name | Distributions[^1] | Stability[^2] |" in extension_table
         assert (
-            "| [healthcheckextension](https://github.com/open-telemetry/opentelemetry-collector-contrib/tree/main/extension/healthcheckextension) | contrib | beta |"
+            f"| [healthcheckextension]({_CONTRIB}/extension/healthcheckextension) | contrib | beta |"
             in extension_table
         )
 
-    def test_generate_all_component_tables_empty_inventory(self, doc_generator):
+    def test_generate_all_component_tables_empty_inventory(self, all_tables_empty):
         """Test with empty inventory."""
-        inventory = {"components": {}}
-
-        tables = doc_generator.generate_all_component_tables(inventory)
+        tables = all_tables_empty
 
         # Should still return all component types with empty tables plus extension-footnotes
-        assert len(tables) == 6
-        assert "receiver" in tables
-        assert "processor" in tables
-        assert "exporter" in tables
-        assert "connector" in tables
-        assert "extension" in tables
-        assert "extension-footnotes" in tables
+        assert tables.keys() == EXPECTED_TABLE_KEYS
 
         # Each table should have structure but no components
         for table_key, table in tables.items():
@@ -576,97 +624,29 @@ class TestExtensionSubtypes:
         table = doc_generator.generate_component_table("extension", components, subtype="encoding")
 
         # Should have nested path: extension/encoding/otlpencodingextension
-        assert (
-            "https://github.com/open-telemetry/opentelemetry-collector-contrib/tree/main/extension/encoding/otlpencodingextension"
-            in table
-        )
+        assert f"{_CONTRIB}/extension/encoding/otlpencodingextension" in table
 
-    def test_generate_component_table_without_subtype_regular_path(self, doc_generator):
+    def test_generate_component_table_without_subtype_regular_path(self, rendered_tables):
         """Test that regular extensions have non-nested paths."""
-        components = [
-            {
-                "name": "healthcheckextension",
-                "metadata": {
-                    "status": {"stability": {"beta": ["extension"]}, "distributions": ["contrib"]}
-                },
-            }
-        ]
-
-        table = doc_generator.generate_component_table("extension", components, subtype=None)
+        table = rendered_tables["extension_basic"]
 
         # Should have regular path: extension/healthcheckextension
-        assert (
-            "https://github.com/open-telemetry/opentelemetry-collector-contrib/tree/main/extension/healthcheckextension"
-            in table
-        )
+        assert f"{_CONTRIB}/extension/healthcheckextension" in table
         # Should NOT have nested path
         assert "/extension/encoding/" not in table
         assert "/extension/observer/" not in table
         assert "/extension/storage/" not in table
 
-    def test_generate_all_component_tables_includes_subtypes(self, doc_generator):
+    def test_generate_all_component_tables_includes_subtypes(self, all_tables_subtypes):
         """Test that generate_all_component_tables includes subtype tables."""
-        inventory = {
-            "components": {
-                "receiver": [],
-                "processor": [],
-                "exporter": [],
-                "connector": [],
-                "extension": [
-                    {
-                        "name": "healthcheckextension",
-                        "metadata": {
-                            "status": {
-                                "stability": {"beta": ["extension"]},
-                                "distributions": ["contrib"],
-                            }
-                        },
-                    },
-                    {
-                        "name": "otlpencodingextension",
-                        "subtype": "encoding",
-                        "metadata": {
-                            "status": {
-                                "stability": {"beta": ["extension"]},
-                                "distributions": ["contrib"],
-                            }
-                        },
-                    },
-                    {
-                        "name": "hostobserver",
-                        "subtype": "observer",
-                        "metadata": {
-                            "status": {
-                                "stability": {"alpha": ["extension"]},
-                                "distributions": ["contrib"],
-                            }
-                        },
-                    },
-                    {
-                        "name": "filestorage",
-                        "subtype": "storage",
-                        "metadata": {
-                            "status": {
-                                "stability": {"beta": ["extension"]},
-                                "distributions": ["contrib"],
-                            }
-                        },
-                    },
-                ],
-            }
-        }
-
-        tables = doc_generator.generate_all_component_tables(inventory)
+        tables = all_tables_subtypes
 
         # Should have all standard tables plus subtype tables
-        assert "receiver" in tables
-        assert "processor" in tables
-        assert "exporter" in tables
-        assert "connector" in tables
-        assert "extension" in tables  # Main extensions
-        assert "extension-encoding" in tables
-        assert "extension-observer" in tables
-        assert "extension-storage" in tables
+        assert tables.keys() == EXPECTED_TABLE_KEYS | {
+            "extension-encoding",
+            "extension-observer",
+            "extension-storage",
+        }
 
         # Main extension table should only have healthcheckextension
         assert "healthcheckextension" in tables["extension"]
@@ -694,65 +674,20 @@ class TestExtensionSubtypes:
                 "processor": [],
                 "exporter": [],
                 "connector": [],
-                "extension": [
-                    {
-                        "name": "healthcheckextension",
-                        "metadata": {
-                            "status": {
-                                "stability": {"beta": ["extension"]},
-                                "distributions": ["contrib"],
-                            }
-                        },
-                    },
-                    # No encoding/observer/storage extensions
-                ],
+                # No encoding/observer/storage extensions
+                "extension": COMPONENTS_EXTENSION_BASIC,
             }
         }
 
         tables = doc_generator.generate_all_component_tables(inventory)
 
-        # Should still have main extension table
-        assert "extension" in tables
-        assert "healthcheckextension" in tables["extension"]
-
         # Subtype tables should not be created if no components have that subtype
-        assert "extension-encoding" not in tables
-        assert "extension-observer" not in tables
-        assert "extension-storage" not in tables
+        assert tables.keys() == EXPECTED_TABLE_KEYS
+        assert "healthcheckextension" in tables["extension"]
 
-    def test_subtype_tables_have_no_footnotes(self, doc_generator):
+    def test_subtype_tables_have_no_footnotes(self, all_tables_subtypes):
         """Test that subtype tables don't include footnotes (footnotes are separate)."""
-        inventory = {
-            "components": {
-                "receiver": [],
-                "processor": [],
-                "exporter": [],
-                "connector": [],
-                "extension": [
-                    {
-                        "name": "healthcheckextension",
-                        "metadata": {
-                            "status": {
-                                "stability": {"beta": ["extension"]},
-                                "distributions": ["contrib"],
-                            }
-                        },
-                    },
-                    {
-                        "name": "otlpencodingextension",
-                        "subtype": "encoding",
-                        "metadata": {
-                            "status": {
-                                "stability": {"beta": ["extension"]},
-                                "distributions": ["contrib"],
-                            }
-                        },
-                    },
-                ],
-            }
-        }
-
-        tables = doc_generator.generate_all_component_tables(inventory)
+        tables = all_tables_subtypes
 
         # Main extension table should NOT have footnotes (they're separate now)
         assert "[^1]:\n    Shows which [distributions]" not in tables["extension"]
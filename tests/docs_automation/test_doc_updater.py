@@ -1,16 +1,26 @@
 """Tests for documentation updater."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from docs_automation.doc_updater import DocUpdater
 
+MULTI_SECTION_CONTENT = """# Page
 
-@pytest.fixture
+<!-- BEGIN GENERATED: section1 -->
+Old 1
+<!-- END GENERATED: section1 -->
+
+Text
+
+<!-- BEGIN GENERATED: section2 -->
+Old 2
+<!-- END GENERATED: section2 -->
+"""
+
+
+@pytest.fixture(scope="module")
 def doc_updater():
-    """Create a DocUpdater instance for testing."""
+    """Create a DocUpdater instance shared by the module (it holds no per-call state)."""
     return DocUpdater()
 
 
@@ -29,6 +39,14 @@ More manual content below.
 """
 
 
+@pytest.fixture
+def sample_file(tmp_path, sample_content):
+    """Markdown file containing sample_content."""
+    file_path = tmp_path / "sample.md"
+    file_path.write_text(sample_content)
+    return file_path
+
+
 class TestUpdateSection:
     """Tests for update_section method."""
 
@@ -138,27 +156,37 @@ Footer"""
         assert "<!-- END GENERATED: test-section SOURCE: collector-watcher -->" in updated
         assert "Old generated content here" not in updated
 
+    def test_update_section_missing_end_marker(self, doc_updater):
+        """Test that a BEGIN marker without a matching END marker is left untouched."""
+        content = "Intro\n<!-- BEGIN GENERATED: test-section -->\nOld\n" * 100
+        updated, was_updated = doc_updater.update_section(content, "test-section", "New")
 
-class TestUpdateMultipleSections:
-    """Tests for update_multiple_sections method."""
+        assert not was_updated
+        assert updated == content
 
-    def test_update_multiple_sections(self, doc_updater):
-        """Test updating multiple sections."""
-        content = """# Page
+    def test_update_section_ignores_marker_id_prefix(self, doc_updater):
+        """Test that a marker ID does not match a longer ID sharing its prefix."""
+        content = """<!-- BEGIN GENERATED: section-2 -->
+Other
+<!-- END GENERATED: section-2 -->
+<!-- BEGIN GENERATED: section -->
+Old
+<!-- END GENERATED: section -->"""
+        updated, was_updated = doc_updater.update_section(content, "section", "New")
 
-<!-- BEGIN GENERATED: section1 -->
-Old 1
-<!-- END GENERATED: section1 -->
+        assert was_updated
+        assert "Other" in updated
+        assert "Old" not in updated
+        assert "<!-- BEGIN GENERATED: section-2 -->" in updated
 
-Text
 
-<!-- BEGIN GENERATED: section2 -->
-Old 2
-<!-- END GENERATED: section2 -->
-"""
+class TestUpdateMultipleSections:
+    """Tests for update_multiple_sections method."""
 
+    def test_update_multiple_sections(self, doc_updater):
+        """Test updating multiple sections."""
         updates = {"section1": "New 1", "section2": "New 2"}
-        updated, results = doc_updater.update_multiple_sections(content, updates)
+        updated, results = doc_updater.update_multiple_sections(MULTI_SECTION_CONTENT, updates)
 
         assert results["section1"]
         assert results["section2"]
@@ -166,6 +194,109 @@ Old 2
         assert "New 2" in updated
         assert "Old 1" not in updated
         assert "Old 2" not in updated
+        assert "Text" in updated
+
+    def test_update_multiple_sections_many(self, doc_updater):
+        """Test that many sections are all replaced in one call."""
+        content = "\n\n".join(
+            f"<!-- BEGIN GENERATED: section{i} -->\nOld {i}\n<!-- END GENERATED: section{i} -->"
+            for i in range(50)
+        )
+        updates = {f"section{i}": f"new{i}" for i in range(50)}
+
+        updated, results = doc_updater.update_multiple_sections(content, updates)
+
+        assert all(results.values())
+        assert len(results) == 50
+        for i in range(50):
+            assert (
+                f"<!-- BEGIN GENERATED: section{i} SOURCE: collector-watcher -->\n"
+                f"new{i}\n"
+                f"<!-- END GENERATED: section{i} SOURCE: collector-watcher -->"
+            ) in updated
+        assert "Old" not in updated
+
+    def test_update_multiple_sections_preserves_backslashes(self, doc_updater):
+        """Test that replacement content is inserted literally."""
+        updated, results = doc_updater.update_multiple_sections(
+            MULTI_SECTION_CONTENT, {"section1": r"C:\path\1"}
+        )
+
+        assert results["section1"]
+        assert r"C:\path\1" in updated
+
+    def test_update_multiple_sections_mixed_formats(self, doc_updater):
+        """Test that old and new marker formats are both updated in one pass."""
+        content = MULTI_SECTION_CONTENT.replace(
+            "<!-- END GENERATED: section2 -->",
+            "<!-- END GENERATED: section2 SOURCE: collector-watcher -->",
+        )
+        updated, results = doc_updater.update_multiple_sections(
+            content, {"section1": "New 1", "section2": "New 2"}
+        )
+
+        assert results == {"section1": True, "section2": True}
+        assert updated.count("SOURCE: collector-watcher") == 4
+        assert "Old" not in updated
+        assert updated.startswith("# Page\n")
+        assert "\nText\n" in updated
+
+    def test_update_multiple_sections_non_word_id(self, doc_updater):
+        """Test that IDs update_section accepts are also found when updating several."""
+        content = "<!-- BEGIN GENERATED: a.b -->\nOld\n<!-- END GENERATED: a.b -->\n"
+
+        updated, results = doc_updater.update_multiple_sections(content, {"a.b": "New"})
+
+        assert results == {"a.b": True}
+        assert updated == doc_updater.update_section(content, "a.b", "New")[0]
+
+    @pytest.mark.parametrize(
+        "order",
+        [("outer", "inner"), ("inner", "outer")],
+        ids=["outer_first", "inner_first"],
+    )
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "<!-- BEGIN GENERATED: outer -->\n"
+            "<!-- BEGIN GENERATED: inner -->\nOld inner\n<!-- END GENERATED: inner -->\n"
+            "Old outer\n"
+            "<!-- END GENERATED: outer -->\n",
+            "<!-- BEGIN GENERATED: outer -->\nOld outer\n"
+            "<!-- BEGIN GENERATED: inner -->\nOld inner\n<!-- END GENERATED: outer -->\n"
+            "<!-- END GENERATED: inner -->\n",
+        ],
+        ids=["nested", "crossing"],
+    )
+    def test_update_multiple_sections_overlapping(self, doc_updater, content, order):
+        """Test that overlapping sections give the same result as updating one at a time."""
+        updates = {marker_id: f"New {marker_id}" for marker_id in order}
+
+        sequential = content
+        sequential_results = {}
+        for marker_id, new_content in updates.items():
+            sequential, sequential_results[marker_id] = doc_updater.update_section(
+                sequential, marker_id, new_content
+            )
+
+        updated, results = doc_updater.update_multiple_sections(content, updates)
+
+        assert results == sequential_results
+        assert updated == sequential
+
+    def test_update_multiple_sections_nested_inner_first(self, doc_updater):
+        """Test that a nested section updated before its enclosing one is reported as updated."""
+        content = (
+            "<!-- BEGIN GENERATED: outer -->\n"
+            "<!-- BEGIN GENERATED: inner -->\nOld inner\n<!-- END GENERATED: inner -->\n"
+            "<!-- END GENERATED: outer -->\n"
+        )
+
+        _, results = doc_updater.update_multiple_sections(
+            content, {"inner": "New inner", "outer": "New outer"}
+        )
+
+        assert results == {"inner": True, "outer": True}
 
     def test_update_multiple_sections_partial(self, doc_updater):
         """Test updating multiple sections when some don't exist."""
@@ -187,20 +318,13 @@ Old 1
 class TestUpdateFile:
     """Tests for update_file method."""
 
-    def test_update_file(self, doc_updater, sample_content):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(sample_content)
-            temp_path = Path(f.name)
+    def test_update_file(self, doc_updater, sample_file):
+        success = doc_updater.update_file(sample_file, "test-section", "Updated file content")
 
-        try:
-            success = doc_updater.update_file(temp_path, "test-section", "Updated file content")
-
-            assert success
-            updated_content = temp_path.read_text()
-            assert "Updated file content" in updated_content
-            assert "Old generated content here" not in updated_content
-        finally:
-            temp_path.unlink()
+        assert success
+        updated_content = sample_file.read_text()
+        assert "Updated file content" in updated_content
+        assert "Old generated content here" not in updated_content
 
     def test_update_file_not_found(self, doc_updater):
         with pytest.raises(FileNotFoundError):
@@ -210,32 +334,17 @@ class TestUpdateFile:
 class TestUpdateFileMultiple:
     """Tests for update_file_multiple method."""
 
-    def test_update_file_multiple(self, doc_updater):
+    def test_update_file_multiple(self, doc_updater, tmp_path):
         """Test updating multiple sections in a file."""
-        content = """# Page
-
-<!-- BEGIN GENERATED: section1 -->
-Old 1
-<!-- END GENERATED: section1 -->
+        temp_path = tmp_path / "multiple.md"
+        temp_path.write_text(MULTI_SECTION_CONTENT)
 
-<!-- BEGIN GENERATED: section2 -->
-Old 2
-<!-- END GENERATED: section2 -->
-"""
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_path = Path(f.name)
-
-        try:
-            updates = {"section1": "New 1", "section2": "New 2"}
-            results = doc_updater.update_file_multiple(temp_path, updates)
+        updates = {"section1": "New 1", "section2": "New 2"}
+        results = doc_updater.update_file_multiple(temp_path, updates)
 
-            assert results["section1"]
-            assert results["section2"]
+        assert results["section1"]
+        assert results["section2"]
 
-            updated_content = temp_path.read_text()
-            assert "New 1" in updated_content
-            assert "New 2" in updated_content
-        finally:
-            temp_path.unlink()
+        updated_content = temp_path.read_text()
+        assert "New 1" in updated_content
+        assert "New 2" in updated_content
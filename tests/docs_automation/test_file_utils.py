@@ -0,0 +1,62 @@
+"""Tests for file helpers."""
+
+import stat
+
+import pytest
+
+from docs_automation import file_utils
+from docs_automation.file_utils import write_text_atomic
+
+
+def test_write_text_atomic_replaces_content(tmp_path):
+    """Test that the file is replaced and no temporary file is left behind."""
+    target = tmp_path / "sample.md"
+    target.write_text("Original")
+
+    write_text_atomic(target, "Replaced")
+
+    assert target.read_text() == "Replaced"
+    assert [p.name for p in tmp_path.iterdir()] == ["sample.md"]
+
+
+def test_write_text_atomic_cleans_up_on_failure(tmp_path):
+    """Test that a failed write leaves no temporary file behind."""
+    target = tmp_path / "sample.md"
+
+    with pytest.raises(TypeError):
+        write_text_atomic(target, b"not text")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_write_text_atomic_follows_symlink(tmp_path):
+    """Test that writing through a symlink updates the target and keeps the link."""
+    target = tmp_path / "real.md"
+    target.write_text("Original")
+    link = tmp_path / "link.md"
+    link.symlink_to(target)
+
+    write_text_atomic(link, "Replaced")
+
+    assert link.is_symlink()
+    assert target.read_text() == "Replaced"
+
+
+def test_write_text_atomic_preserves_mode(tmp_path):
+    """Test that an existing file keeps its permission bits."""
+    target = tmp_path / "private.md"
+    target.write_text("Original")
+    target.chmod(0o600)
+
+    write_text_atomic(target, "Replaced")
+
+    assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+
+def test_write_text_atomic_new_file_mode(tmp_path):
+    """Test that a new file gets the umask-based mode rather than owner-only access."""
+    target = tmp_path / "new.md"
+
+    write_text_atomic(target, "Content")
+
+    assert stat.S_IMODE(target.stat().st_mode) == 0o666 & ~file_utils._UMASK
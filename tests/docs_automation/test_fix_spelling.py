@@ -1,23 +1,24 @@
 """Tests for spelling fix functionality."""
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import yaml
 
 from docs_automation.fix_spelling import (
+    _update_frontmatter_ignore_list_text,
     load_component_names,
     update_frontmatter_ignore_list,
 )
 
 
-@pytest.fixture
-def temp_inventory(tmp_path):
-    """Create a temporary inventory structure for testing."""
-    import yaml
-
+@pytest.fixture(scope="session")
+def temp_inventory(tmp_path_factory):
+    """Create a temporary inventory structure shared by all tests (read-only usage)."""
     # Create inventory structure
-    inventory_dir = tmp_path / "collector-metadata"
+    inventory_dir = tmp_path_factory.mktemp("inventory") / "collector-metadata"
     contrib_dir = inventory_dir / "contrib"
     v140_dir = contrib_dir / "v0.140.0"
     v140_dir.mkdir(parents=True)
@@ -36,7 +37,7 @@ def temp_inventory(tmp_path):
     }
 
     with open(v140_dir / "receiver.yaml", "w") as f:
-        yaml.dump(receiver_data, f)
+        yaml.safe_dump(receiver_data, f)
 
     # Create exporter.yaml with sample components
     exporter_data = {
@@ -51,7 +52,7 @@ def temp_inventory(tmp_path):
     }
 
     with open(v140_dir / "exporter.yaml", "w") as f:
-        yaml.dump(exporter_data, f)
+        yaml.safe_dump(exporter_data, f)
 
     # Also create a snapshot version that should be ignored
     snapshot_dir = contrib_dir / "v0.141.0-SNAPSHOT"
@@ -68,7 +69,7 @@ def temp_inventory(tmp_path):
     }
 
     with open(snapshot_dir / "receiver.yaml", "w") as f:
-        yaml.dump(snapshot_data, f)
+        yaml.safe_dump(snapshot_data, f)
 
     return inventory_dir
 
@@ -90,10 +91,16 @@ def test_load_component_names(temp_inventory):
     assert len(component_names) == 6
 
 
-def test_update_frontmatter_with_existing_cspell_line(tmp_path):
+def test_load_component_names_cached(temp_inventory):
+    """Test that repeat loads of the same inventory reuse the cached result."""
+    first = load_component_names(temp_inventory)
+
+    assert load_component_names(temp_inventory) is first
+    assert isinstance(first, frozenset)
+
+
+def test_update_frontmatter_with_existing_cspell_line():
     """Test updating frontmatter when cSpell:ignore line already exists."""
-    # Create a test markdown file
-    test_file = tmp_path / "test.md"
     original_content = """---
 title: Test Page
 description: Test description
@@ -105,17 +112,13 @@ cSpell:ignore: existingword anotherword
 
 Some test content here.
 """
-    test_file.write_text(original_content)
 
     # Add new words
     new_words = {"newword", "zebra"}
-    result = update_frontmatter_ignore_list(test_file, new_words)
+    updated_content, result = _update_frontmatter_ignore_list_text(original_content, new_words)
 
     assert result is True
 
-    # Read updated content
-    updated_content = test_file.read_text()
-
     # Should contain all words in sorted order
     assert "cSpell:ignore: anotherword existingword newword zebra" in updated_content
 
@@ -128,10 +131,8 @@ Some test content here.
     assert "Some test content here." in updated_content
 
 
-def test_update_frontmatter_without_cspell_line(tmp_path):
+def test_update_frontmatter_without_cspell_line():
     """Test adding cSpell:ignore line when it doesn't exist."""
-    # Create a test markdown file without cSpell:ignore
-    test_file = tmp_path / "test.md"
     original_content = """---
 title: Test Page
 description: Test description
@@ -142,17 +143,13 @@ weight: 100
 
 Some test content here.
 """
-    test_file.write_text(original_content)
 
     # Add new words
     new_words = {"newword", "zebra"}
-    result = update_frontmatter_ignore_list(test_file, new_words)
+    updated_content, result = _update_frontmatter_ignore_list_text(original_content, new_words)
 
     assert result is True
 
-    # Read updated content
-    updated_content = test_file.read_text()
-
     # Should contain new cSpell:ignore line with sorted words
     assert "cSpell:ignore: newword zebra" in updated_content
 
@@ -164,10 +161,8 @@ Some test content here.
     assert "# Test Content" in updated_content
 
 
-def test_update_frontmatter_no_duplicates(tmp_path):
+def test_update_frontmatter_no_duplicates():
     """Test that adding existing words doesn't create duplicates."""
-    # Create a test markdown file
-    test_file = tmp_path / "test.md"
     original_content = """---
 title: Test Page
 cSpell:ignore: existingword anotherword
@@ -175,17 +170,13 @@ cSpell:ignore: existingword anotherword
 
 # Test Content
 """
-    test_file.write_text(original_content)
 
     # Try to add words that already exist
     new_words = {"existingword", "newword"}
-    result = update_frontmatter_ignore_list(test_file, new_words)
+    updated_content, result = _update_frontmatter_ignore_list_text(original_content, new_words)
 
     assert result is True
 
-    # Read updated content
-    updated_content = test_file.read_text()
-
     # Should contain each word only once, sorted
     assert "cSpell:ignore: anotherword existingword newword" in updated_content
 
@@ -193,26 +184,39 @@ cSpell:ignore: existingword anotherword
     assert updated_content.count("existingword") == 1
 
 
-def test_update_frontmatter_case_insensitive_sort(tmp_path):
-    """Test that words are sorted case-insensitively."""
+def test_update_frontmatter_already_ignored_skips_write(tmp_path):
+    """Test that the file isn't rewritten when every word is already ignored."""
     test_file = tmp_path / "test.md"
     original_content = """---
 title: Test Page
+cSpell:ignore: anotherword existingword
+---
+"""
+    test_file.write_text(original_content)
+    os.utime(test_file, ns=(0, 0))
+
+    result = update_frontmatter_ignore_list(test_file, {"existingword"})
+
+    assert result is True
+    assert test_file.read_text() == original_content
+    assert test_file.stat().st_mtime_ns == 0
+
+
+def test_update_frontmatter_case_insensitive_sort():
+    """Test that words are sorted case-insensitively."""
+    original_content = """---
+title: Test Page
 ---
 
 # Test Content
 """
-    test_file.write_text(original_content)
 
     # Add words with mixed case
     new_words = {"Zebra", "apple", "Banana"}
-    result = update_frontmatter_ignore_list(test_file, new_words)
+    updated_content, result = _update_frontmatter_ignore_list_text(original_content, new_words)
 
     assert result is True
 
-    # Read updated content
-    updated_content = test_file.read_text()
-
     # Should be sorted case-insensitively: apple, Banana, Zebra
     assert "cSpell:ignore: apple Banana Zebra" in updated_content
 
@@ -237,9 +241,40 @@ Some test content without frontmatter.
     assert test_file.read_text() == original_content
 
 
-def test_update_frontmatter_preserves_formatting(tmp_path):
+def test_update_frontmatter_ignores_horizontal_rules():
+    """Test that only the first closing delimiter ends the front matter."""
+    original_content = """---
+title: Test Page
+---
+
+# Test Content
+
+---
+
+More content
+"""
+
+    updated_content, result = _update_frontmatter_ignore_list_text(original_content, {"newword"})
+
+    assert result is True
+    assert updated_content == original_content.replace(
+        "title: Test Page\n", "title: Test Page\ncSpell:ignore: newword\n"
+    )
+
+
+def test_update_frontmatter_empty_cspell_line():
+    """Test that an existing but empty cSpell:ignore line is filled in, not duplicated."""
+    original_content = "---\ntitle: Test Page\ncSpell:ignore:\n---\n\n# Test Content\n"
+
+    updated_content, result = _update_frontmatter_ignore_list_text(original_content, {"newword"})
+
+    assert result is True
+    assert updated_content.count("cSpell:ignore:") == 1
+    assert "cSpell:ignore: newword\n" in updated_content
+
+
+def test_update_frontmatter_preserves_formatting():
     """Test that frontmatter formatting is preserved."""
-    test_file = tmp_path / "test.md"
     original_content = """---
 title: Test Page
 description: |
@@ -252,17 +287,13 @@ cSpell:ignore: existingword
 
 # Test Content
 """
-    test_file.write_text(original_content)
 
     # Add new words
     new_words = {"newword"}
-    result = update_frontmatter_ignore_list(test_file, new_words)
+    updated_content, result = _update_frontmatter_ignore_list_text(original_content, new_words)
 
     assert result is True
 
-    # Read updated content
-    updated_content = test_file.read_text()
-
     # Should preserve multi-line description
     assert "Multi-line" in updated_content
     assert "description" in updated_content
@@ -288,12 +319,20 @@ cSpell:ignore: existingword
 
     # Try to add empty set of words
     new_words = set()
-    update_frontmatter_ignore_list(test_file, new_words)
+    result = update_frontmatter_ignore_list(test_file, new_words)
 
     # Should still return True as the function can process the file
     # But the content should remain unchanged
-    updated_content = test_file.read_text()
-    assert "cSpell:ignore: existingword" in updated_content
+    assert result is True
+    assert test_file.read_text() == original_content
+
+
+def test_update_frontmatter_empty_word_set_skips_io(tmp_path):
+    """Test that an empty word set returns before touching the file."""
+    missing_file = tmp_path / "missing.md"
+
+    assert update_frontmatter_ignore_list(missing_file, set()) is True
+    assert not missing_file.exists()
 
 
 @patch("docs_automation.fix_spelling.subprocess.run")
@@ -324,6 +363,23 @@ CSpell: Files checked: 5, Issues found: 3 in 2 files.
     exporter_words = result["content/en/docs/collector/components/exporter.md"]
     assert "kafkaexporter" in exporter_words
 
+    # Should return a plain dict so missing files raise rather than appear empty
+    assert type(result) is dict
+
+
+@patch("docs_automation.fix_spelling.subprocess.run")
+def test_run_cspell_parses_paths_with_colons(mock_run):
+    """Test that paths containing a colon, such as Windows drive paths, are kept whole."""
+    from docs_automation.fix_spelling import run_cspell
+
+    mock_run.return_value = MagicMock(
+        stdout="C:\\docs\\receiver.md:25:4 - Unknown word (awslambdareceiver)\n", returncode=1
+    )
+
+    result = run_cspell(Path("/fake/path"))
+
+    assert result == {"C:\\docs\\receiver.md": ["awslambdareceiver"]}
+
 
 def test_integration_with_realistic_frontmatter(tmp_path):
     """Test with realistic frontmatter from actual collector docs."""
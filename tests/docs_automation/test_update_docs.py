@@ -1,94 +1,20 @@
 """Tests for update_docs functionality."""
 
-import tempfile
-from pathlib import Path
+import re
 
 import pytest
-import yaml
 
 from collector_watcher.inventory import InventoryManager
 from collector_watcher.version_detector import Version
 from docs_automation.update_docs import get_best_available_version, merge_inventories
 
+_NO_VERSIONS_RE = re.compile("No versions found")
 
-@pytest.fixture
-def temp_inventory_dir():
-    """Create a temporary inventory directory with test data."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-
-        # Create test data structure
-        # Core: v0.140.0 (stable)
-        core_v140_0 = tmpdir_path / "core" / "v0.140.0"
-        core_v140_0.mkdir(parents=True)
-
-        core_data = {
-            "distribution": "core",
-            "version": "v0.140.0",
-            "repository": "opentelemetry-collector",
-            "component_type": "extension",
-            "components": [
-                {
-                    "name": "memorylimiterextension",
-                    "metadata": {
-                        "status": {
-                            "distributions": [],
-                            "stability": {"development": ["extension"]},
-                        }
-                    },
-                }
-            ],
-        }
-
-        with open(core_v140_0 / "extension.yaml", "w") as f:
-            yaml.dump(core_data, f)
-
-        # Core: v0.139.0 (older stable)
-        core_v139_0 = tmpdir_path / "core" / "v0.139.0"
-        core_v139_0.mkdir(parents=True)
-
-        older_core_data = core_data.copy()
-        older_core_data["version"] = "v0.139.0"
-
-        with open(core_v139_0 / "extension.yaml", "w") as f:
-            yaml.dump(older_core_data, f)
-
-        # Contrib: v0.140.1 (stable)
-        contrib_v140_1 = tmpdir_path / "contrib" / "v0.140.1"
-        contrib_v140_1.mkdir(parents=True)
-
-        contrib_data = {
-            "distribution": "contrib",
-            "version": "v0.140.1",
-            "repository": "opentelemetry-collector-contrib",
-            "component_type": "extension",
-            "components": [
-                {
-                    "name": "ackextension",
-                    "metadata": {
-                        "status": {
-                            "distributions": ["contrib"],
-                            "stability": {"alpha": ["extension"]},
-                        }
-                    },
-                }
-            ],
-        }
-
-        with open(contrib_v140_1 / "extension.yaml", "w") as f:
-            yaml.dump(contrib_data, f)
-
-        # Contrib: v0.140.0 (older stable)
-        contrib_v140_0 = tmpdir_path / "contrib" / "v0.140.0"
-        contrib_v140_0.mkdir(parents=True)
-
-        older_contrib_data = contrib_data.copy()
-        older_contrib_data["version"] = "v0.140.0"
-
-        with open(contrib_v140_0 / "extension.yaml", "w") as f:
-            yaml.dump(older_contrib_data, f)
-
-        yield tmpdir_path
+V0_138_0 = Version.from_string("v0.138.0")
+V0_139_0 = Version.from_string("v0.139.0")
+V0_140_0 = Version.from_string("v0.140.0")
+V0_140_1 = Version.from_string("v0.140.1")
+V0_150_0 = Version.from_string("v0.150.0")
 
 
 class TestGetBestAvailableVersion:
@@ -97,7 +23,7 @@ class TestGetBestAvailableVersion:
     def test_exact_version_exists(self, temp_inventory_dir):
         """Test when the exact version exists."""
         inv_mgr = InventoryManager(str(temp_inventory_dir))
-        target_version = Version.from_string("v0.140.0")
+        target_version = V0_140_0
 
         result = get_best_available_version(inv_mgr, "core", target_version)
 
@@ -106,31 +32,40 @@ class TestGetBestAvailableVersion:
     def test_fallback_to_previous_version(self, temp_inventory_dir):
         """Test fallback when target version doesn't exist."""
         inv_mgr = InventoryManager(str(temp_inventory_dir))
-        target_version = Version.from_string("v0.140.1")  # Doesn't exist for core
+        target_version = V0_140_1  # Doesn't exist for core
 
         result = get_best_available_version(inv_mgr, "core", target_version)
 
         # Should fall back to v0.140.0 (latest available before target)
-        assert result == Version.from_string("v0.140.0")
+        assert result == V0_140_0
 
     def test_no_versions_available(self, temp_inventory_dir):
         """Test when no versions are available."""
         inv_mgr = InventoryManager(str(temp_inventory_dir))
-        target_version = Version.from_string("v0.140.0")
+        target_version = V0_140_0
 
         # Try to get version for a distribution that doesn't exist
-        with pytest.raises(ValueError, match="No versions found"):
+        with pytest.raises(ValueError, match=_NO_VERSIONS_RE):
             get_best_available_version(inv_mgr, "nonexistent", target_version)
 
     def test_fallback_to_oldest_when_all_newer(self, temp_inventory_dir):
         """Test fallback to oldest version when all versions are newer than target."""
         inv_mgr = InventoryManager(str(temp_inventory_dir))
-        target_version = Version.from_string("v0.138.0")  # Older than available
+        target_version = V0_138_0  # Older than available
 
         result = get_best_available_version(inv_mgr, "core", target_version)
 
         # Should return the oldest available version
-        assert result == Version.from_string("v0.139.0")
+        assert result == V0_139_0
+
+    def test_fallback_to_newest_when_all_older(self, temp_inventory_dir):
+        """Test fallback to newest version when all versions are older than target."""
+        inv_mgr = InventoryManager(str(temp_inventory_dir))
+        target_version = V0_150_0  # Newer than available
+
+        result = get_best_available_version(inv_mgr, "contrib", target_version)
+
+        assert result == V0_140_1
 
 
 class TestMergeInventories:
@@ -218,7 +153,7 @@ class TestMergeInventories:
         receiver = receivers[0]
         assert receiver["name"] == "otlpreceiver"
         assert receiver["source_repo"] == "core"  # Should prefer core
-        assert set(receiver["metadata"]["status"]["distributions"]) == {"core", "contrib"}
+        assert receiver["metadata"]["status"]["distributions"] == ["contrib", "core"]
 
     def test_merge_skips_experimental_components(self):
         """Test that experimental 'x' components are skipped."""
@@ -249,6 +184,15 @@ class TestMergeInventories:
         assert len(receivers) == 1
         assert receivers[0]["name"] == "otlpreceiver"
 
+    def test_merge_keeps_other_x_prefixed_components(self):
+        """Test that only the exact experimental name is skipped, not every 'x' prefix."""
+        core_inventory = {"components": {"receiver": [{"name": "xreceiver"}]}}
+        contrib_inventory = {"components": {"receiver": [{"name": "xrayreceiver"}]}}
+
+        result = merge_inventories(core_inventory, contrib_inventory)
+
+        assert [r["name"] for r in result["components"]["receiver"]] == ["xrayreceiver"]
+
     def test_merge_empty_inventories(self):
         """Test merging when one inventory is empty."""
         core_inventory = {"components": {}}
@@ -294,12 +238,10 @@ class TestMergeInventories:
 
         result = merge_inventories(core_inventory, contrib_inventory)
 
-        receivers = result["components"]["receiver"]
-        core_rec = next(r for r in receivers if r["name"] == "corereceiver")
-        contrib_rec = next(r for r in receivers if r["name"] == "contribreceiver")
+        by_name = {r["name"]: r for r in result["components"]["receiver"]}
 
-        assert core_rec["source_repo"] == "core"
-        assert contrib_rec["source_repo"] == "contrib"
+        assert by_name["corereceiver"]["source_repo"] == "core"
+        assert by_name["contribreceiver"]["source_repo"] == "contrib"
 
     def test_merge_sorts_components(self):
         """Test that merged components are sorted by name."""
@@ -1,11 +1,18 @@
 """Integration test to validate the version mismatch bug fix."""
 
-from collector_watcher.inventory import InventoryManager
 from collector_watcher.version_detector import Version
 from docs_automation.update_docs import get_best_available_version, merge_inventories
 
+V0_140_0 = Version.from_string("v0.140.0")
+V0_140_1 = Version.from_string("v0.140.1")
 
-def test_version_mismatch_bugfix_with_real_metadata():
+
+def _total(inventory: dict) -> int:
+    """Count the components of every type in an inventory."""
+    return sum(map(len, inventory.get("components", {}).values()))
+
+
+def test_version_mismatch_bugfix_with_real_metadata(merged_v140):
     """
     Test that the version mismatch bug is fixed using real metadata.
 
@@ -14,35 +21,20 @@ def test_version_mismatch_bugfix_with_real_metadata():
     - Core is still at v0.140.0
     - Documentation generation should not lose core components
     """
-    inv_mgr = InventoryManager("collector-metadata")
-
-    # The target version (what we want to generate docs for)
-    target_version = Version.from_string("v0.140.1")
-
-    # Get best available versions for each distribution
-    core_version = get_best_available_version(inv_mgr, "core", target_version)
-    contrib_version = get_best_available_version(inv_mgr, "contrib", target_version)
-
     # Core should fall back to v0.140.0 since v0.140.1 doesn't exist
-    assert core_version == Version.from_string("v0.140.0")
+    assert merged_v140.core_version == V0_140_0
 
     # Contrib should use v0.140.1 since it exists
-    assert contrib_version == Version.from_string("v0.140.1")
-
-    # Load inventories
-    core_inventory = inv_mgr.load_versioned_inventory("core", core_version)
-    contrib_inventory = inv_mgr.load_versioned_inventory("contrib", contrib_version)
+    assert merged_v140.contrib_version == V0_140_1
 
     # Verify we got data for both distributions
-    assert core_inventory["version"] == "v0.140.0"
-    assert contrib_inventory["version"] == "v0.140.1"
-
-    # Merge inventories
-    merged = merge_inventories(core_inventory, contrib_inventory)
+    assert merged_v140.core_inventory["version"] == "v0.140.0"
+    assert merged_v140.contrib_inventory["version"] == "v0.140.1"
 
     # Get extension components
-    extensions = merged["components"]["extension"]
-    extension_names = {ext["name"] for ext in extensions}
+    extensions = merged_v140.merged["components"]["extension"]
+    extensions_by_name = {ext["name"]: ext for ext in extensions}
+    extension_names = extensions_by_name.keys()
 
     # The bug was that memorylimiterextension was missing
     # This should now be present
@@ -51,7 +43,7 @@ def test_version_mismatch_bugfix_with_real_metadata():
     )
 
     # Verify it's marked as coming from core
-    memory_limiter = next(ext for ext in extensions if ext["name"] == "memorylimiterextension")
+    memory_limiter = extensions_by_name["memorylimiterextension"]
     assert memory_limiter["source_repo"] == "core"
 
     # Also verify contrib extensions are present
@@ -61,34 +53,17 @@ def test_version_mismatch_bugfix_with_real_metadata():
     assert len(found_contrib) > 0, "Should have contrib-only extensions"
 
 
-def test_version_mismatch_does_not_cause_data_loss():
+def test_version_mismatch_does_not_cause_data_loss(merged_v140):
     """
     Test that version mismatch doesn't cause component data loss.
 
     Specifically tests that we don't lose core components when
     contrib is at a newer version.
     """
-    inv_mgr = InventoryManager("collector-metadata")
-
-    target_version = Version.from_string("v0.140.1")
-
-    # Get inventories using fallback mechanism
-    core_version = get_best_available_version(inv_mgr, "core", target_version)
-    contrib_version = get_best_available_version(inv_mgr, "contrib", target_version)
-
-    core_inventory = inv_mgr.load_versioned_inventory("core", core_version)
-    contrib_inventory = inv_mgr.load_versioned_inventory("contrib", contrib_version)
-
-    merged = merge_inventories(core_inventory, contrib_inventory)
-
     # Count components in each
-    core_component_count = sum(
-        len(comps) for comps in core_inventory.get("components", {}).values()
-    )
-    contrib_component_count = sum(
-        len(comps) for comps in contrib_inventory.get("components", {}).values()
-    )
-    merged_component_count = sum(len(comps) for comps in merged.get("components", {}).values())
+    core_component_count = _total(merged_v140.core_inventory)
+    contrib_component_count = _total(merged_v140.contrib_inventory)
+    merged_component_count = _total(merged_v140.merged)
 
     # The merged count should be at least as many as the contrib count
     # (since some components are in both, merged count < core + contrib)
@@ -107,14 +82,14 @@ def test_version_mismatch_does_not_cause_data_loss():
     assert merged_component_count > 0, "Merged inventory should have components"
 
 
-def test_no_version_mismatch_when_both_exist():
+def test_no_version_mismatch_when_both_exist(real_inventory_manager):
     """
     Test that when both versions exist, no fallback occurs.
     """
-    inv_mgr = InventoryManager("collector-metadata")
+    inv_mgr = real_inventory_manager
 
     # Use v0.140.0 which exists for both
-    target_version = Version.from_string("v0.140.0")
+    target_version = V0_140_0
 
     core_version = get_best_available_version(inv_mgr, "core", target_version)
     contrib_version = get_best_available_version(inv_mgr, "contrib", target_version)
@@ -130,4 +105,4 @@ def test_no_version_mismatch_when_both_exist():
     merged = merge_inventories(core_inventory, contrib_inventory)
 
     # Should have components from both
-    assert sum(len(comps) for comps in merged["components"].values()) > 0
+    assert _total(merged) > 0